@@ -1,8 +1,8 @@
 """Example usage of the vcfx Python module.
 
-This script shows how to source ``add_vcfx_tools_to_path.sh`` to make the
-compiled tools available, query ``vcfx.available_tools()``, run a tool, and
-perform basic error handling.
+This script shows how to make the compiled tools available on ``PATH`` (the
+same directories ``add_vcfx_tools_to_path.sh`` would add), query
+``vcfx.available_tools()``, run a tool, and perform basic error handling.
 """
 from __future__ import annotations
 
@@ -13,20 +13,38 @@ from pathlib import Path
 import vcfx
 
 # ----------------------------------------------------------------------------
-# 1. Source add_vcfx_tools_to_path.sh
+# 1. Add the VCFX tool directories to PATH
 # ----------------------------------------------------------------------------
 
 # Determine the repository root relative to this file
 REPO_ROOT = Path(__file__).resolve().parents[1]
-script = REPO_ROOT / "add_vcfx_tools_to_path.sh"
 
-# Use a subshell to source the script and print the resulting PATH
-# so we can update our environment accordingly.
+
+def vcfx_tool_dirs(repo_root: Path) -> list[str]:
+    """Return the directories ``add_vcfx_tools_to_path.sh`` would add."""
+    build = repo_root / "build"
+    bases = [build / "src", *sorted(build.glob("*/src"))]
+    if any(Path("/usr/local/bin").glob("VCFX_*")):
+        bases.append(Path("/usr/local/bin"))
+
+    dirs: list[str] = []
+    for base in bases:
+        if not base.is_dir():
+            continue
+        for pattern in ("VCFX_*", "vcfx"):
+            for exe in base.rglob(pattern):
+                if exe.is_file() and os.access(exe, os.X_OK):
+                    if str(exe.parent) not in dirs:
+                        dirs.append(str(exe.parent))
+    return dirs
+
+
+# Build PATH in-process rather than sourcing the shell script in a subshell.
 # When running interactively you can simply execute:
 #   source /path/to/add_vcfx_tools_to_path.sh
-cmd = ["bash", "-c", f"source {script} >/dev/null && printf '%s' \"$PATH\""]
-new_path = subprocess.check_output(cmd, text=True)
-os.environ["PATH"] = new_path
+tool_dirs = vcfx_tool_dirs(REPO_ROOT)
+if tool_dirs:
+    os.environ["PATH"] = os.pathsep.join([*tool_dirs, os.environ.get("PATH", "")])
 
 # ----------------------------------------------------------------------------
 # 2. Query available tools and run one
@@ -35,11 +53,14 @@ os.environ["PATH"] = new_path
 print("Available tools:", vcfx.available_tools())
 
 # Run a simple tool via the generic helper. Here we count the variants in a
-# small VCF located under the tests directory.
+# small VCF located under the tests directory. The open file is handed to the
+# tool as its standard input, so the VCF is read by the tool directly from the
+# file descriptor instead of being loaded into Python first.
 vcf_file = REPO_ROOT / "tests" / "data" / "variant_counter_normal.vcf"
 
 try:
-    result = vcfx.run_tool("variant_counter", str(vcf_file), capture_output=True)
+    with open(vcf_file, "rb") as fh:
+        result = vcfx.run_tool("variant_counter", stdin=fh, capture_output=True)
     print("variant_counter output:", result.stdout.strip())
 except FileNotFoundError as exc:
     print("Tool not found:", exc)
@@ -4,31 +4,87 @@ import os
 
 """Python bindings for the VCFX toolkit."""
 
+# ``typing`` is only needed by type checkers; importing it at runtime would
+# noticeably add to ``import vcfx`` latency.
+_TYPE_CHECKING = False
+if _TYPE_CHECKING:  # pragma: no cover - typing only
+    from typing import Any, Iterable
+
 try:
     from ._vcfx import *  # type: ignore  # noqa: F401,F403
 except ModuleNotFoundError:  # pragma: no cover - fallback for pure Python envs
-    import gzip
-    from pathlib import Path
-    from importlib.metadata import PackageNotFoundError, version
-
-    def trim(text: str) -> str:
-        """Return *text* without leading/trailing whitespace."""
-        return text.strip()
-
-    def split(text: str, delim: str) -> list[str]:
-        """Split *text* on *delim* returning a list."""
-        return text.split(delim)
+    import zlib
+
+    try:  # pragma: no cover - optional accelerated zlib
+        from isal import isal_zlib as _zlib
+        _ZLIB_ERRORS: tuple[type[Exception], ...] = (
+            zlib.error,
+            _zlib.error,
+        )
+    except ImportError:  # pragma: no cover - isal not installed
+        _zlib = zlib
+        _ZLIB_ERRORS = (zlib.error,)
+
+    _GZIP_MAGIC = b"\x1f\x8b"
+    _READ_BUFFER_SIZE = 128 * 1024
+
+    # The string methods themselves serve as the fallbacks for
+    # ``trim(text)`` and ``split(text, delim)``, saving a Python frame per
+    # call.
+    trim = str.strip
+    split = str.split
+
+    def _gunzip(chunks: Iterable[bytes | memoryview]) -> bytes:
+        """Decompress the concatenated gzip members (e.g. BGZF) in *chunks*."""
+        out = bytearray()
+        decomp = _zlib.decompressobj(wbits=31)
+        pending = False
+        chunk: bytes | memoryview
+        for chunk in chunks:
+            while chunk:
+                out += decomp.decompress(chunk)
+                pending = not decomp.eof
+                if pending:
+                    break
+                chunk = decomp.unused_data
+                decomp = _zlib.decompressobj(wbits=31)
+        if pending:
+            raise EOFError(
+                "Compressed file ended before the end-of-stream marker "
+                "was reached"
+            )
+        return bytes(out)
 
     def read_maybe_compressed(data: bytes) -> bytes:
         """Decompress *data* if it is gzip-compressed."""
+        # Only gzip/BGZF streams start with the magic bytes; skip the
+        # decompressor (and its exception path) for plain input.
+        if data[:2] != _GZIP_MAGIC:
+            return data
+        view = memoryview(data)
         try:
-            return gzip.decompress(data)
-        except OSError:
+            return _gunzip(
+                view[i:i + _READ_BUFFER_SIZE]
+                for i in range(0, len(view), _READ_BUFFER_SIZE)
+            )
+        except _ZLIB_ERRORS:
             return data
 
     def read_file_maybe_compressed(path: str) -> bytes:
         """Read a possibly compressed file."""
-        return read_maybe_compressed(Path(path).read_bytes())
+        # Decompress straight from the file instead of holding both the
+        # compressed and decompressed contents in memory at once.
+        with open(path, "rb", buffering=_READ_BUFFER_SIZE) as fh:
+            if fh.read(2) == _GZIP_MAGIC:
+                fh.seek(0)
+                try:
+                    return _gunzip(
+                        iter(lambda: fh.read(_READ_BUFFER_SIZE), b"")
+                    )
+                except _ZLIB_ERRORS:
+                    pass
+            fh.seek(0)
+            return fh.read()
 
     def get_version() -> str:
         """Return the toolkit version when bindings are unavailable."""
@@ -37,6 +93,8 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for pure Python envs
         if env_version:
             return env_version
 
+        from importlib.metadata import PackageNotFoundError, version
+
         try:
             return version(__package__ or "vcfx")
         except PackageNotFoundError:
@@ -50,76 +108,12 @@ except ModuleNotFoundError:  # pragma: no cover - fallback for pure Python envs
             except Exception:
                 return "0.0.0"
 
-__version__ = get_version()
-
-try:
-    from . import tools as _tools  # noqa: E402
-except ImportError:  # pragma: no cover - optional subpackage
-    _tools = None  # type: ignore[assignment]
-
-if _tools is not None:
-    try:
-        from .tools import TOOL_NAMES  # noqa: E402
-    except FileNotFoundError:  # pragma: no cover - depends on external binaries
-        TOOL_NAMES = []
-else:  # pragma: no cover - tools package missing
-    TOOL_NAMES = []
-from typing import Callable  # noqa: E402
-import subprocess  # noqa: E402
-from .results import (  # noqa: E402
-    AlignmentDiscrepancy,
-    AlleleCount,
-    AlleleFrequency,
-    InfoSummary,
-    AlleleBalance,
-    ConcordanceRow,
-    HWEResult,
-    InbreedingCoefficient,
-    VariantClassification,
-    CrossSampleConcordanceRow,
-    AncestryAssignment,
-    DosageRow,
-    AncestryInference,
-    DistanceRow,
-    IndexEntry,
-)
+import importlib  # noqa: E402
+from types import ModuleType  # noqa: E402
 
-# Re-export helper functions for convenience
-if _tools is not None:
-    available_tools = _tools.available_tools
-    run_tool = _tools.run_tool
-else:  # pragma: no cover - tools package missing
-    def available_tools(refresh: bool = False) -> list[str]:
-        raise FileNotFoundError("vcfx tools package not installed")
-
-    from typing import Any
-
-    def run_tool(*args: str, **kwargs: Any) -> subprocess.CompletedProcess:
-        raise FileNotFoundError("vcfx tools package not installed")
-
-# Export command wrappers if the vcfx helper is available.  When the
-# wrapper cannot be located on ``PATH`` importing ``vcfx`` should still
-# succeed so that helper functions like :func:`trim` remain usable.  In
-# that case the tool wrappers will be resolved lazily via
-# ``__getattr__``.
-if _tools is not None:
-    try:  # pragma: no cover - depends on external binaries being built
-        for _name in TOOL_NAMES:
-            if _name in vars(_tools):
-                globals()[_name] = getattr(_tools, _name)
-    except FileNotFoundError:
-        # Tools are unavailable; they will be looked up on demand.
-        pass
-
-__all__ = [
-    "trim",
-    "split",
-    "read_file_maybe_compressed",
-    "read_maybe_compressed",
-    "get_version",
-    "available_tools",
-    "run_tool",
-    *TOOL_NAMES,
+# Result dataclasses are imported from :mod:`vcfx.results` on first access.
+# This tuple is the single source for both that lookup and ``__all__``.
+_RESULT_NAMES = (
     "AlignmentDiscrepancy",
     "AlleleCount",
     "AlleleFrequency",
@@ -135,28 +129,123 @@ __all__ = [
     "AncestryInference",
     "DistanceRow",
     "IndexEntry",
-    "__version__",
-]
+)
+_RESULT_NAME_SET = frozenset(_RESULT_NAMES)
+
+# Submodules that may be accessed as attributes without importing them first
+_SUBMODULES = frozenset({"tools", "results", "results_np"})
+
+# Public names that are always available, followed in ``__all__`` by the
+# tool wrappers and result classes
+_HELPER_NAMES = (
+    "trim",
+    "split",
+    "read_file_maybe_compressed",
+    "read_maybe_compressed",
+    "get_version",
+    "available_tools",
+    "run_tool",
+    "run_tool_stream",
+    "run_pipeline",
+    "run_tool_async",
+    "run_many",
+    "set_cache_size",
+    "clear_cache",
+    "make_runner",
+)
+
+
+def _missing_tools(*args: Any, **kwargs: Any) -> Any:
+    raise FileNotFoundError("vcfx tools package not installed")
+
+
+# Stand-ins for the :mod:`vcfx.tools` helpers if that package is missing
+_TOOL_STUBS: dict[str, Any] = {
+    "available_tools": _missing_tools,
+    "run_tool": _missing_tools,
+    "run_tool_stream": _missing_tools,
+    "run_pipeline": _missing_tools,
+    "run_tool_async": _missing_tools,
+    "run_many": _missing_tools,
+    "set_cache_size": _missing_tools,
+    "clear_cache": _missing_tools,
+    "make_runner": _missing_tools,
+}
+
+
+def _load_tools() -> ModuleType | None:
+    """Import :mod:`vcfx.tools` on first use, or return ``None``."""
+    try:
+        return importlib.import_module(".tools", __name__)
+    except ImportError:  # pragma: no cover - optional subpackage
+        return None
+
+
+def _tool_names() -> list[str]:
+    """Return the names of the tool wrappers provided by :mod:`vcfx.tools`."""
+    tools = _load_tools()
+    if tools is None:  # pragma: no cover - tools package missing
+        return []
+    return list(tools.TOOL_NAMES)
 
 
-def __getattr__(name: str) -> Callable[..., subprocess.CompletedProcess]:
-    """Return a wrapper for a VCFX command line tool.
+def __getattr__(name: str) -> Any:
+    """Return a lazily resolved attribute of the package.
 
     Parameters
     ----------
     name : str
-        Name of the tool without the ``VCFX_`` prefix.
+        ``"__version__"``, ``"__all__"``, ``"TOOL_NAMES"``, a submodule, the
+        name of a class from :mod:`vcfx.results`, a helper such as
+        ``run_tool`` or the name of a tool without the ``VCFX_`` prefix.
 
     Returns
     -------
-    Callable[..., subprocess.CompletedProcess]
-        Callable that runs the requested tool.
+    Any
+        The requested value, e.g. the version string, a dataclass, or a
+        callable that runs the requested tool.
 
     Raises
     ------
     AttributeError
-        If *name* does not correspond to an available tool.
+        If *name* does not correspond to a result class or an available tool.
+
+    Notes
+    -----
+    Nothing beyond the helper functions is bound at import time:
+    :mod:`vcfx.tools` (and with it :mod:`subprocess`) and
+    :mod:`vcfx.results` are only imported when one of their names is first
+    accessed.  Resolved values are stored in the module namespace so that
+    subsequent lookups bypass this function entirely.
     """
-    if _tools is None:
-        raise AttributeError(name)
-    return getattr(_tools, name)
+    value: Any
+    if name == "__version__":
+        value = get_version()
+    elif name in _RESULT_NAME_SET:
+        results = importlib.import_module(".results", __name__)
+        value = getattr(results, name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    elif name == "__all__":
+        value = [*_HELPER_NAMES, *_tool_names(), *_RESULT_NAMES, "__version__"]
+    elif name == "TOOL_NAMES":
+        value = _tool_names()
+    elif name.startswith("_"):
+        # Private and dunder probes (IPython, copy, inspect, ...) never name
+        # a tool; reject them without importing :mod:`vcfx.tools`.
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        tools = _load_tools()
+        if tools is not None:
+            value = getattr(tools, name)
+        elif name in _TOOL_STUBS:  # pragma: no cover - tools package missing
+            value = _TOOL_STUBS[name]
+        else:  # pragma: no cover - tools package missing
+            raise AttributeError(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the module attributes, including lazily resolved ones."""
+    return sorted(set(globals()) | set(__getattr__("__all__")))
@@ -0,0 +1,119 @@
+# This file is generated by scripts/generate_stubs.py; do not edit by hand.
+from __future__ import annotations
+
+import os
+import subprocess
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+import numpy as np
+
+from . import results as results
+from . import tools as tools
+from .results import (
+    AlignmentDiscrepancy as AlignmentDiscrepancy,
+    AlleleCount as AlleleCount,
+    AlleleFrequency as AlleleFrequency,
+    InfoSummary as InfoSummary,
+    AlleleBalance as AlleleBalance,
+    ConcordanceRow as ConcordanceRow,
+    HWEResult as HWEResult,
+    InbreedingCoefficient as InbreedingCoefficient,
+    VariantClassification as VariantClassification,
+    CrossSampleConcordanceRow as CrossSampleConcordanceRow,
+    AncestryAssignment as AncestryAssignment,
+    DosageRow as DosageRow,
+    AncestryInference as AncestryInference,
+    DistanceRow as DistanceRow,
+    IndexEntry as IndexEntry,
+)
+
+T = TypeVar("T")
+
+__version__: str
+TOOL_NAMES: list[str]
+__all__: list[str]
+
+def trim(text: str) -> str: ...
+def split(text: str, delim: str) -> list[str]: ...
+def read_file_maybe_compressed(path: str) -> bytes: ...
+def read_maybe_compressed(data: bytes) -> bytes: ...
+def get_version() -> str: ...
+def available_tools(refresh: bool = False) -> list[str]: ...
+def run_tool(tool: str, *args: str, check: bool = True, capture_output: bool = False, text: bool = True, **kwargs: Any) -> subprocess.CompletedProcess: ...
+def run_tool_stream(tool: str, *args: str, row_cls: Type[T] | None = None, delimiter: str = '\t', buffer_size: int = 131072, check: bool = True, **kwargs: Any) -> Iterator[Any]: ...
+def run_pipeline(stages: Sequence[tuple[str, Sequence[str]]], vcf_file: str | os.PathLike[str], text: bool = True, buffer_size: int = 131072, check: bool = True) -> Iterator[Any]: ...
+async def run_tool_async(tool: str, *args: str, stdin_path: str | os.PathLike[str] | None = None, check: bool = True, text: bool = True) -> subprocess.CompletedProcess: ...
+async def run_many(jobs: Iterable[Sequence[Any]], limit: int | None = None, check: bool = True, text: bool = True) -> list[subprocess.CompletedProcess]: ...
+def set_cache_size(maxsize: int) -> None: ...
+def clear_cache() -> None: ...
+def make_runner(tool: str, *args: str) -> Callable[..., subprocess.CompletedProcess]: ...
+def alignment_checker(vcf_file: str, reference: str) -> list[AlignmentDiscrepancy]: ...
+def allele_counter(vcf_file: str, samples: Sequence[str] | None = None) -> list[AlleleCount]: ...
+def variant_counter(vcf_file: str, strict: bool = False) -> int: ...
+def allele_freq_calc(vcf_file: str, as_arrays: bool = False) -> list[AlleleFrequency] | dict[str, np.ndarray]: ...
+def ancestry_assigner(vcf_file: str, freq_file: str) -> list[AncestryAssignment]: ...
+def allele_balance_calc(vcf_file: str, samples: Sequence[str] | None = None, as_arrays: bool = False) -> list[AlleleBalance] | dict[str, np.ndarray]: ...
+def dosage_calculator(vcf_file: str, as_arrays: bool = False) -> list[DosageRow] | dict[str, np.ndarray]: ...
+def concordance_checker(vcf_file: str, sample1: str, sample2: str) -> list[ConcordanceRow]: ...
+def genotype_query(vcf_file: str, genotype: str, strict: bool = False, binary: bool = False) -> str | bytes: ...
+def duplicate_remover(vcf_file: str, binary: bool = False) -> str | bytes: ...
+def info_aggregator(vcf_file: str, fields: Sequence[str], binary: bool = False) -> str | bytes: ...
+def info_parser(vcf_file: str, fields: Sequence[str], columnar: bool = False) -> list[dict] | dict[str, list]: ...
+def info_summarizer(vcf_file: str, fields: Sequence[str]) -> list[InfoSummary]: ...
+def fasta_converter(vcf_file: str, binary: bool = False) -> str | bytes: ...
+def af_subsetter(vcf_file: str, af_range: str, binary: bool = False) -> str | bytes: ...
+def allele_balance_filter(vcf_file: str, threshold: float, binary: bool = False) -> str | bytes: ...
+def record_filter(vcf_file: str, criteria: str, logic: str | None = None, binary: bool = False) -> str | bytes: ...
+def missing_detector(vcf_file: str, binary: bool = False) -> str | bytes: ...
+def hwe_tester(vcf_file: str, as_arrays: bool = False) -> list[HWEResult] | dict[str, np.ndarray]: ...
+def inbreeding_calculator(vcf_file: str, freq_mode: str = 'excludeSample', skip_boundary: bool = False, as_arrays: bool = False) -> list[InbreedingCoefficient] | dict[str, np.ndarray]: ...
+def variant_classifier(vcf_file: str, append_info: bool = False, binary: bool = False) -> list[VariantClassification] | str | bytes: ...
+def cross_sample_concordance(vcf_file: str, samples: Sequence[str] | None = None) -> list[CrossSampleConcordanceRow]: ...
+def field_extractor(vcf_file: str, fields: Sequence[str], columnar: bool = False) -> list[dict] | dict[str, list]: ...
+def ancestry_inferrer(vcf_file: str, freq_file: str) -> list[AncestryInference]: ...
+def annotation_extractor(vcf_file: str, fields: Sequence[str], columnar: bool = False) -> list[dict] | dict[str, list]: ...
+def compressor(vcf_file: str, compress: bool = True) -> bytes: ...
+def custom_annotator(vcf_file: str, annotation_file: str) -> str: ...
+def diff_tool(file1: str, file2: str) -> str: ...
+def distance_calculator(vcf_file: str) -> list[DistanceRow]: ...
+def file_splitter(vcf_file: str, prefix: str = 'split', output_dir: str | None = None) -> list[str]: ...
+def format_converter(vcf_file: str, to_format: str) -> str: ...
+def gl_filter(vcf_file: str, condition: str, mode: str = 'all') -> str: ...
+def haplotype_extractor(vcf_file: str, block_size: int = 100000, check_phase_consistency: bool = False, columnar: bool = False) -> list[dict] | dict[str, list]: ...
+def haplotype_phaser(vcf_file: str, ld_threshold: float = 0.8) -> str: ...
+def header_parser(vcf_file: str) -> str: ...
+def impact_filter(vcf_file: str, level: str) -> str: ...
+def indel_normalizer(vcf_file: str) -> str: ...
+def indexer(vcf_file: str, header: bool = True) -> list[IndexEntry]: ...
+def ld_calculator(vcf_file: str, region: str | None = None) -> str: ...
+def merger(vcf_files: Sequence[str]) -> str: ...
+def metadata_summarizer(vcf_file: str) -> str: ...
+def missing_data_handler(vcf_file: str, fill_missing: bool = False, default_genotype: str = './.') -> str: ...
+def multiallelic_splitter(vcf_file: str) -> str: ...
+def nonref_filter(vcf_file: str) -> str: ...
+def outlier_detector(vcf_file: str, metric: str, threshold: float, mode: str = 'variant', columnar: bool = False) -> list[dict] | dict[str, list]: ...
+def phase_checker(vcf_file: str) -> str: ...
+def phase_quality_filter(vcf_file: str, condition: str) -> str: ...
+def phred_filter(vcf_file: str, threshold: float = 30.0, keep_missing_qual: bool = False) -> str: ...
+def population_filter(vcf_file: str, pop_tag: str, pop_map: str) -> str: ...
+def position_subsetter(vcf_file: str, region: str) -> str: ...
+def probability_filter(vcf_file: str, condition: str) -> str: ...
+def quality_adjuster(vcf_file: str, func: str, no_clamp: bool = False) -> str: ...
+def ref_comparator(vcf_file: str, reference: str) -> str: ...
+def reformatter(vcf_file: str, compress_info: Sequence[str] | None = None, compress_format: Sequence[str] | None = None, reorder_info: Sequence[str] | None = None, reorder_format: Sequence[str] | None = None) -> str: ...
+def region_subsampler(vcf_file: str, bed_file: str) -> str: ...
+def sample_extractor(vcf_file: str, samples: Sequence[str]) -> str: ...
+def sorter(vcf_file: str, natural_chr: bool = False) -> str: ...
+def subsampler(vcf_file: str, n: int, seed: int | None = None) -> str: ...
+def sv_handler(vcf_file: str, sv_filter_only: bool = False, sv_modify: bool = False) -> str: ...
+def validator(vcf_file: str, strict: bool = False, report_dups: bool = False) -> str: ...
+
+def __getattr__(name: str) -> Callable[..., subprocess.CompletedProcess]: ...
@@ -1,6 +1,7 @@
 #include "vcfx_core.h"
 #include <Python.h>
-#include <sstream>
+#include <istream>
+#include <streambuf>
 #include <string>
 #include <vector>
 
@@ -10,7 +11,7 @@ static PyObject *to_py_list(const std::vector<std::string> &vec) {
     if (!list)
         return nullptr;
     for (size_t i = 0; i < vec.size(); ++i) {
-        PyObject *item = PyUnicode_FromString(vec[i].c_str());
+        PyObject *item = PyUnicode_FromStringAndSize(vec[i].data(), vec[i].size());
         if (!item) {
             Py_DECREF(list);
             return nullptr;
@@ -20,29 +21,63 @@ static PyObject *to_py_list(const std::vector<std::string> &vec) {
     return list;
 }
 
-static PyObject *py_trim(PyObject *, PyObject *args) {
-    const char *text;
-    if (!PyArg_ParseTuple(args, "s", &text))
+// Read-only streambuf over an existing buffer so Python bytes-like objects
+// can be handed to the std::istream based readers without copying them.
+class MemoryBuf : public std::streambuf {
+  public:
+    MemoryBuf(const char *data, size_t size) {
+        char *p = const_cast<char *>(data);
+        setg(p, p, p + size);
+    }
+};
+
+// Same whitespace set as vcfx::trim.  Compared explicitly rather than with
+// strchr, which would also match the NUL terminator.
+static inline bool is_trim_space(char c) { return c == ' ' || c == '\t' || c == '\n' || c == '\r'; }
+
+static PyObject *py_trim(PyObject *, PyObject *arg) {
+    Py_ssize_t size;
+    const char *text = PyUnicode_AsUTF8AndSize(arg, &size);
+    if (!text)
         return nullptr;
-    std::string result = vcfx::trim(text);
-    return PyUnicode_FromString(result.c_str());
+    // Slicing the UTF-8 buffer directly avoids building intermediate
+    // std::string copies.
+    Py_ssize_t first = 0;
+    while (first < size && is_trim_space(text[first]))
+        ++first;
+    Py_ssize_t last = size;
+    while (last > first && is_trim_space(text[last - 1]))
+        --last;
+    return PyUnicode_FromStringAndSize(text + first, last - first);
 }
 
-static PyObject *py_split(PyObject *, PyObject *args) {
-    const char *text;
-    const char *delim;
-    if (!PyArg_ParseTuple(args, "ss", &text, &delim))
+static PyObject *py_split(PyObject *, PyObject *const *args, Py_ssize_t nargs) {
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError, "split() takes exactly 2 arguments (%zd given)", nargs);
+        return nullptr;
+    }
+    Py_ssize_t size;
+    const char *text = PyUnicode_AsUTF8AndSize(args[0], &size);
+    if (!text)
+        return nullptr;
+    const char *delim = PyUnicode_AsUTF8(args[1]);
+    if (!delim)
         return nullptr;
-    std::vector<std::string> parts = vcfx::split(text, delim[0]);
+    std::vector<std::string> parts = vcfx::split(std::string(text, size), delim[0]);
     return to_py_list(parts);
 }
 
-static PyObject *py_read_file(PyObject *, PyObject *args) {
-    const char *path;
-    if (!PyArg_ParseTuple(args, "s", &path))
+static PyObject *py_read_file(PyObject *, PyObject *arg) {
+    const char *path = PyUnicode_AsUTF8(arg);
+    if (!path)
         return nullptr;
+    std::string path_str(path);
     std::string out;
-    if (!vcfx::read_file_maybe_compressed(path, out)) {
+    bool ok;
+    Py_BEGIN_ALLOW_THREADS
+    ok = vcfx::read_file_maybe_compressed(path_str, out);
+    Py_END_ALLOW_THREADS
+    if (!ok) {
         PyErr_SetString(PyExc_RuntimeError, "Failed to read file");
         return nullptr;
     }
@@ -54,15 +89,20 @@ static PyObject *py_get_version(PyObject *, PyObject *) {
     return PyUnicode_FromString(ver.c_str());
 }
 
-static PyObject *py_read_stream(PyObject *, PyObject *args) {
+static PyObject *py_read_stream(PyObject *, PyObject *arg) {
     Py_buffer buf;
-    if (!PyArg_ParseTuple(args, "y*", &buf))
+    if (PyObject_GetBuffer(arg, &buf, PyBUF_SIMPLE) != 0)
         return nullptr;
-    std::string data(static_cast<const char *>(buf.buf), buf.len);
-    PyBuffer_Release(&buf);
-    std::istringstream ss(data);
     std::string out;
-    if (!vcfx::read_maybe_compressed(ss, out)) {
+    bool ok;
+    // The decompression runs on the caller's buffer without holding the GIL.
+    Py_BEGIN_ALLOW_THREADS
+    MemoryBuf mem(static_cast<const char *>(buf.buf), buf.len);
+    std::istream in(&mem);
+    ok = vcfx::read_maybe_compressed(in, out);
+    Py_END_ALLOW_THREADS
+    PyBuffer_Release(&buf);
+    if (!ok) {
         PyErr_SetString(PyExc_RuntimeError, "Failed to read data");
         return nullptr;
     }
@@ -70,11 +110,11 @@ static PyObject *py_read_stream(PyObject *, PyObject *args) {
 }
 
 static PyMethodDef VcfxMethods[] = {
-    {"trim", py_trim, METH_VARARGS, "Trim leading and trailing whitespace"},
-    {"split", py_split, METH_VARARGS, "Split a string on the given delimiter"},
-    {"read_file_maybe_compressed", py_read_file, METH_VARARGS,
-     "Read a (possibly compressed) file and return its contents"},
-    {"read_maybe_compressed", py_read_stream, METH_VARARGS, "Decompress bytes if needed and return the contents"},
+    {"trim", py_trim, METH_O, "Trim leading and trailing whitespace"},
+    {"split", reinterpret_cast<PyCFunction>(reinterpret_cast<void (*)(void)>(py_split)), METH_FASTCALL,
+     "Split a string on the given delimiter"},
+    {"read_file_maybe_compressed", py_read_file, METH_O, "Read a (possibly compressed) file and return its contents"},
+    {"read_maybe_compressed", py_read_stream, METH_O, "Decompress bytes if needed and return the contents"},
     {"get_version", py_get_version, METH_NOARGS, "Return VCFX version string"},
     {nullptr, nullptr, 0, nullptr}};
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
 
 __all__ = [
     "AlignmentDiscrepancy",
@@ -21,7 +25,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AlignmentDiscrepancy:
     CHROM: str
     POS: int
@@ -33,7 +37,7 @@ class AlignmentDiscrepancy:
     VCF_Value: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AlleleCount:
     CHROM: str
     POS: int
@@ -45,7 +49,7 @@ class AlleleCount:
     Alt_Count: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AlleleFrequency:
     CHROM: str
     POS: int
@@ -55,7 +59,7 @@ class AlleleFrequency:
     Allele_Frequency: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InfoSummary:
     INFO_Field: str
     Mean: float
@@ -63,7 +67,7 @@ class InfoSummary:
     Mode: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AlleleBalance:
     CHROM: str
     POS: int
@@ -74,7 +78,7 @@ class AlleleBalance:
     Allele_Balance: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConcordanceRow:
     CHROM: str
     POS: int
@@ -86,7 +90,7 @@ class ConcordanceRow:
     Concordance: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HWEResult:
     CHROM: str
     POS: int
@@ -96,13 +100,13 @@ class HWEResult:
     HWE_pvalue: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InbreedingCoefficient:
     Sample: str
     InbreedingCoefficient: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VariantClassification:
     CHROM: str
     POS: int
@@ -112,7 +116,7 @@ class VariantClassification:
     Classification: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CrossSampleConcordanceRow:
     CHROM: str
     POS: int
@@ -124,13 +128,13 @@ class CrossSampleConcordanceRow:
     Concordance_Status: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AncestryAssignment:
     Sample: str
     Assigned_Population: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DosageRow:
     CHROM: str
     POS: int
@@ -139,14 +143,41 @@ class DosageRow:
     ALT: str
     Dosages: str
 
+    def dosages_array(self) -> np.ndarray:
+        """Return ``Dosages`` as a ``float32`` NumPy array.
+
+        Missing dosages (``NA``) and any other value that is not a number
+        become ``nan``, as in :func:`vcfx.results_np.read_dosage_tsv`.
+        Requires the optional ``numpy`` dependency.  To load the dosages of
+        many variants at once, see :func:`vcfx.results_np.read_dosage_tsv`.
+        """
+        import numpy as np
+
+        if not self.Dosages:
+            return np.empty(0, dtype=np.float32)
+        values = self.Dosages.split(",")
+        try:
+            # NumPy converts the strings in C and accepts "nan"
+            return np.array(values, dtype=np.float32)
+        except ValueError:  # e.g. ``NA``
+            return np.array([_dosage(v) for v in values], dtype=np.float32)
+
+
+def _dosage(value: str) -> float:
+    """Return one dosage field as a float, ``nan`` if it is not a number."""
+    try:
+        return float(value)
+    except ValueError:
+        return float("nan")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AncestryInference:
     Sample: str
     Inferred_Population: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DistanceRow:
     CHROM: str
     POS: int
@@ -154,7 +185,7 @@ class DistanceRow:
     DISTANCE: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IndexEntry:
     CHROM: str
     POS: int
@@ -0,0 +1,366 @@
+"""Columnar loaders for VCFX tool output.
+
+The wrappers in :mod:`vcfx.tools` return one :mod:`vcfx.results` dataclass
+per row, which is convenient but costly for outputs with millions of
+variants.  The helpers in this module read the same tab separated output
+into a :class:`pandas.DataFrame` (and, for dosages, a 2-D
+:class:`numpy.ndarray`) with compact column types instead.
+
+``numpy`` and ``pandas`` are optional dependencies.  Install them with
+``pip install vcfx[dataframe]``.
+"""
+from __future__ import annotations
+
+import gzip
+import subprocess
+from dataclasses import fields as dataclass_fields
+from os import PathLike
+from typing import IO, TYPE_CHECKING, Any, Iterator, Sequence, Type, TypeVar
+
+from .tools.base import _called_process_error, _default_converters, _tool_command
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
+    import pandas as pd
+
+__all__ = [
+    "read_allele_frequency_tsv",
+    "read_dosage_tsv",
+    "read_tsv_arrays",
+    "allele_freq_calc_frame",
+    "dosage_calculator_arrays",
+    "iterate_variants",
+    "to_records",
+]
+
+T = TypeVar("T")
+
+Source = str | PathLike[str] | IO[bytes]
+
+_VARIANT_DTYPES = {
+    "CHROM": "category",
+    "POS": "int32",
+    "ID": "str",
+    "REF": "str",
+    "ALT": "str",
+}
+
+_ALLELE_FREQUENCY_DTYPES = {**_VARIANT_DTYPES, "Allele_Frequency": "float32"}
+
+_DOSAGE_DTYPES = {**_VARIANT_DTYPES, "Dosages": "str"}
+
+# NumPy dtypes used by :func:`read_tsv_arrays` for annotated field types
+_NUMPY_DTYPES: dict[Any, str] = {int: "int64", float: "float64"}
+
+# Fixed VCF columns and the dtypes used for them by :func:`iterate_variants`
+_VCF_COLUMNS = ("CHROM", "POS", "ID", "REF", "ALT", "QUAL", "FILTER", "INFO")
+
+_VCF_DTYPES = {**_VARIANT_DTYPES, "CHROM": "str", "QUAL": "float32",
+               "FILTER": "str", "INFO": "str"}
+
+
+def _read_tsv(source: Source, dtype: dict[str, str]) -> pd.DataFrame:
+    """Read VCFX tab separated output with the pandas C parser."""
+    import pandas as pd
+
+    try:
+        return pd.read_csv(
+            source,
+            sep="\t",
+            dtype=dtype,
+            engine="c",
+            keep_default_na=False,
+            na_values={"Allele_Frequency": ["NA"]},
+        )
+    except pd.errors.EmptyDataError:
+        # No output at all, not even a header line
+        return pd.DataFrame(
+            {name: pd.Series(dtype=kind) for name, kind in dtype.items()}
+        )
+
+
+def read_allele_frequency_tsv(source: Source) -> pd.DataFrame:
+    """Load ``VCFX_allele_freq_calc`` output into a data frame.
+
+    Parameters
+    ----------
+    source : str, os.PathLike or binary file object
+        Path to the tool output or an open stream such as a pipe.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per variant.  ``CHROM`` is categorical, ``POS`` is ``int32``
+        and ``Allele_Frequency`` is ``float32``.  Empty output yields an
+        empty frame with these columns.
+    """
+    return _read_tsv(source, _ALLELE_FREQUENCY_DTYPES)
+
+
+def read_dosage_tsv(source: Source) -> tuple[pd.DataFrame, np.ndarray]:
+    """Load ``VCFX_dosage_calculator`` output as variants and a dosage matrix.
+
+    Parameters
+    ----------
+    source : str, os.PathLike or binary file object
+        Path to the tool output or an open stream such as a pipe.
+
+    Returns
+    -------
+    tuple[pandas.DataFrame, numpy.ndarray]
+        The variant columns (without ``Dosages``) and a
+        ``(n_variants, n_samples)`` ``float32`` array of dosages, the dtype
+        of :meth:`vcfx.results.DosageRow.dosages_array`.  Missing genotypes
+        (``NA``) are stored as ``nan``.
+
+    Raises
+    ------
+    ValueError
+        If the variants do not all have the same number of dosages.
+    """
+    import numpy as np
+    import pandas as pd
+
+    frame = _read_tsv(source, _DOSAGE_DTYPES)
+    dosages = frame.pop("Dosages")
+    # An empty cell holds no dosages rather than one empty field
+    counts = (dosages.str.count(",") + 1).where(dosages != "", 0)
+    if counts.nunique() > 1:
+        raise ValueError(
+            "dosage rows have differing numbers of samples: "
+            f"{', '.join(map(str, sorted(counts.unique())))}"
+        )
+    width = int(counts.iloc[0]) if len(counts) else 0
+    if not width:
+        return frame, np.empty((len(frame), 0), dtype=np.float32)
+    values = pd.to_numeric(
+        pd.Series(",".join(dosages).split(",")), errors="coerce"
+    ).to_numpy(dtype=np.float32)
+    return frame, values.reshape(len(frame), width)
+
+
+def read_tsv_arrays(source: Source, cls: type) -> dict[str, np.ndarray]:
+    """Load VCFX tab separated output into one NumPy array per column.
+
+    Parameters
+    ----------
+    source : str, os.PathLike or binary file object
+        Path to the tool output or an open stream such as a pipe.
+    cls : type
+        :mod:`vcfx.results` dataclass describing the rows; its field
+        annotations select the column types.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        One array per column.  ``int`` fields are ``int64``, ``float``
+        fields are ``float64`` with ``nan`` for missing values (``NA``) and
+        the remaining columns are object arrays of strings.
+    """
+    import numpy as np
+    import pandas as pd
+
+    names = [f.name for f in dataclass_fields(cls)]
+    converters = _default_converters(cls)
+    dtype = {
+        name: _NUMPY_DTYPES.get(converters.get(name), "str") for name in names
+    }
+    floats = [name for name in names if converters.get(name) is float]
+    try:
+        frame = pd.read_csv(
+            source,
+            sep="\t",
+            dtype=dtype,
+            engine="c",
+            keep_default_na=False,
+            na_values={name: ["NA", "nan", "NaN", "."] for name in floats},
+        )
+    except pd.errors.EmptyDataError:
+        return {name: np.empty(0, dtype=dtype[name]) for name in names}
+    return {name: frame[name].to_numpy() for name in frame.columns}
+
+
+def _run_into(
+    tool: str,
+    vcf_file: str | PathLike[str],
+    reader: Any,
+    args: Sequence[str] = (),
+) -> Any:
+    """Run *tool* on *vcf_file* and parse its stdout with *reader*.
+
+    The VCF is passed to the tool as its standard input and the output pipe
+    is handed straight to *reader*, so the table is never held in Python as
+    a string.  Standard error is spooled to a temporary file and attached
+    to the :class:`subprocess.CalledProcessError` raised when the tool
+    fails, as in the list based wrappers.
+    """
+    import tempfile
+
+    cmd = [*_tool_command(tool), *args]
+    with tempfile.TemporaryFile() as err:
+        with open(vcf_file, "rb") as fh:
+            proc = subprocess.Popen(
+                cmd, stdin=fh, stdout=subprocess.PIPE, stderr=err
+            )
+        with proc:
+            assert proc.stdout is not None
+            try:
+                result = reader(proc.stdout)
+            except Exception as exc:
+                proc.stdout.close()
+                if proc.wait() > 0:
+                    raise _called_process_error(proc, cmd, err) from exc
+                raise
+        if proc.returncode:
+            raise _called_process_error(proc, cmd, err)
+    return result
+
+
+def allele_freq_calc_frame(vcf_file: str | PathLike[str]) -> pd.DataFrame:
+    """Columnar counterpart of :func:`vcfx.allele_freq_calc`.
+
+    Parameters
+    ----------
+    vcf_file : str or os.PathLike
+        Path to the VCF input file.
+
+    Returns
+    -------
+    pandas.DataFrame
+        See :func:`read_allele_frequency_tsv`.
+    """
+    return _run_into("allele_freq_calc", vcf_file, read_allele_frequency_tsv)
+
+
+def dosage_calculator_arrays(
+    vcf_file: str | PathLike[str],
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Columnar counterpart of :func:`vcfx.dosage_calculator`.
+
+    Parameters
+    ----------
+    vcf_file : str or os.PathLike
+        Path to the VCF input file.
+
+    Returns
+    -------
+    tuple[pandas.DataFrame, numpy.ndarray]
+        See :func:`read_dosage_tsv`.
+    """
+    return _run_into("dosage_calculator", vcf_file, read_dosage_tsv)
+
+
+def iterate_variants(
+    path: str | PathLike[str],
+    fields: Sequence[str] = ("CHROM", "POS", "REF", "ALT"),
+    chunk_size: int = 65536,
+) -> Iterator[dict[str, np.ndarray]]:
+    """Read the fixed columns of a VCF in chunks of NumPy arrays.
+
+    The file is parsed in-process by the pandas C parser, without starting
+    a tool or round-tripping through its text output.  Plain and gzip/BGZF
+    compressed files are accepted.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path to the VCF file.
+    fields : Sequence[str], optional
+        Columns to load, any of ``CHROM``, ``POS``, ``ID``, ``REF``,
+        ``ALT``, ``QUAL``, ``FILTER`` and ``INFO``.
+    chunk_size : int, optional
+        Maximum number of variants per chunk. Defaults to 65536.
+
+    Yields
+    ------
+    dict[str, numpy.ndarray]
+        One array per requested field.  ``POS`` is ``int32``, ``QUAL`` is
+        ``float32`` with ``nan`` for missing values and the remaining
+        columns are object arrays of strings.  Nothing is yielded for a
+        VCF without data lines.
+
+    Raises
+    ------
+    ValueError
+        If *fields* names a column that is not one of the fixed VCF columns.
+    """
+    import pandas as pd
+
+    unknown = [name for name in fields if name not in _VCF_COLUMNS]
+    if unknown:
+        raise ValueError(f"unknown VCF column(s): {', '.join(unknown)}")
+
+    with open(path, "rb") as raw:
+        magic = raw.read(2)
+        raw.seek(0)
+        fh = gzip.GzipFile(fileobj=raw) if magic == b"\x1f\x8b" else raw
+        # Skip the meta-information lines and the #CHROM header; the data
+        # lines are then handed to the parser as they are.
+        pos = 0
+        for line in fh:
+            if not line.startswith(b"#"):
+                break
+            pos += len(line)
+        fh.seek(pos)
+        columns = {_VCF_COLUMNS.index(name): name for name in fields}
+        try:
+            reader = pd.read_csv(
+                fh,
+                sep="\t",
+                header=None,
+                usecols=list(columns),
+                dtype={i: _VCF_DTYPES[name] for i, name in columns.items()},
+                na_values={_VCF_COLUMNS.index("QUAL"): ["."]},
+                keep_default_na=False,
+                engine="c",
+                chunksize=chunk_size,
+            )
+        except pd.errors.EmptyDataError:
+            return  # header lines only
+        with reader:
+            for chunk in reader:
+                yield {name: chunk[i].to_numpy() for i, name in columns.items()}
+
+
+def _tool_arrays(
+    tool: str,
+    vcf_file: str | PathLike[str],
+    cls: type,
+    args: Sequence[str] = (),
+) -> dict[str, np.ndarray]:
+    """Run *tool* and load its output with :func:`read_tsv_arrays`.
+
+    This backs the ``as_arrays=True`` option of the wrappers in
+    :mod:`vcfx.tools`.  For :class:`~vcfx.results.DosageRow` the
+    ``Dosages`` entry is the 2-D matrix of :func:`read_dosage_tsv`.
+    """
+    from .results import DosageRow
+
+    if cls is DosageRow:
+        frame, dosages = _run_into(tool, vcf_file, read_dosage_tsv, args)
+        arrays = {name: frame[name].to_numpy() for name in frame.columns}
+        arrays["Dosages"] = dosages
+        return arrays
+    return _run_into(
+        tool, vcf_file, lambda src: read_tsv_arrays(src, cls), args
+    )
+
+
+def to_records(frame: pd.DataFrame, cls: Type[T]) -> list[T]:
+    """Convert *frame* to a list of :mod:`vcfx.results` dataclasses.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+        A frame returned by one of the loaders in this module.
+    cls : type
+        Dataclass whose fields name the columns to use.
+
+    Returns
+    -------
+    list
+        Instances of *cls*, as the list based wrappers would return them.
+    """
+    names = [f.name for f in dataclass_fields(cls)]  # type: ignore[arg-type]
+    columns = [frame[name].tolist() for name in names]
+    return [cls(*values) for values in zip(*columns)]
@@ -7,7 +7,7 @@ from setuptools.command.build_ext import build_ext
 
 
 def get_version():
-    """Get version from VERSION file or environment variable."""
+    """Get version from the environment, a VERSION file or CMakeLists.txt."""
     # Try environment variable first
     env_version = os.environ.get("VCFX_VERSION")
     if env_version:
@@ -18,6 +18,19 @@ def get_version():
     if version_file.exists():
         return version_file.read_text().strip()
 
+    # Try the top-level CMakeLists.txt when building from a source checkout
+    script_dir = pathlib.Path(__file__).resolve().parent.parent / "scripts"
+    if (script_dir / "extract_version.py").exists():
+        import sys
+        sys.path.insert(0, str(script_dir))
+        try:
+            from extract_version import extract_version
+            return extract_version()
+        except (ImportError, OSError, RuntimeError):
+            pass
+        finally:
+            sys.path.remove(str(script_dir))
+
     # Fallback
     return "0.0.0"
 
@@ -48,12 +61,33 @@ class CMakeBuild(build_ext):
             print("Warning: CMakeLists.txt not found, building without C++ extension")
             return
 
+        # Reconfigure only when there is no cache yet, CMakeLists.txt is
+        # newer than it, or the configure arguments differ from the ones it
+        # was created with (e.g. an in-place build and a wheel build sharing
+        # ``build_temp`` with different output directories); ``cmake
+        # --build`` re-runs the generator itself if any other CMake input
+        # changed.
+        cmake_cache = build_temp / "CMakeCache.txt"
+        args_stamp = build_temp / "vcfx-cmake-args.txt"
+        stamp = "\n".join([str(source_dir), *cmake_args])
+        try:
+            args_changed = args_stamp.read_text() != stamp
+        except OSError:
+            args_changed = True
+        if (
+            args_changed
+            or not cmake_cache.exists()
+            or cmake_cache.stat().st_mtime
+            < (source_dir / "CMakeLists.txt").stat().st_mtime
+        ):
+            subprocess.check_call(
+                ['cmake', str(source_dir)] + cmake_args,
+                cwd=build_temp,
+            )
+            args_stamp.write_text(stamp)
         subprocess.check_call(
-            ['cmake', str(source_dir)] + cmake_args,
-            cwd=build_temp,
-        )
-        subprocess.check_call(
-            ['cmake', '--build', '.', '--target', '_vcfx'],
+            ['cmake', '--build', '.', '--target', '_vcfx',
+             '--parallel', str(os.cpu_count() or 1)],
             cwd=build_temp,
         )
 
@@ -62,7 +96,7 @@ setup(
     version=get_version(),
     packages=['vcfx', 'vcfx.tools'],
     package_dir={'vcfx': '.'},
-    package_data={'vcfx': ['py.typed']},
+    package_data={'vcfx': ['py.typed', '__init__.pyi']},
     ext_modules=[CMakeExtension('vcfx._vcfx')],
     cmdclass={'build_ext': CMakeBuild},
     zip_safe=False,
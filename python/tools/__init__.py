@@ -1,8 +1,18 @@
 from __future__ import annotations
 """Convenience wrappers for VCFX command line tools."""
-import functools  # noqa: E402
 from . import analysis, filters  # noqa: E402
-from .base import available_tools, run_tool  # noqa: E402
+from .base import (  # noqa: E402
+    _ToolCall,
+    available_tools,
+    clear_cache,
+    make_runner,
+    run_many,
+    run_pipeline,
+    run_tool,
+    run_tool_async,
+    run_tool_stream,
+    set_cache_size,
+)
 
 globals().update({name: getattr(analysis, name) for name in analysis.__all__})
 globals().update({name: getattr(filters, name) for name in filters.__all__})
@@ -13,11 +23,25 @@ TOOL_NAMES: list[str] = [
     *filters.__all__,
 ]
 
-__all__ = ["available_tools", "run_tool", *TOOL_NAMES]
+__all__ = [
+    "available_tools",
+    "run_tool",
+    "run_tool_stream",
+    "run_pipeline",
+    "run_tool_async",
+    "run_many",
+    "set_cache_size",
+    "clear_cache",
+    "make_runner",
+    *TOOL_NAMES,
+]
+
+_TOOL_NAME_SET = frozenset(TOOL_NAMES)
 
 
 def __getattr__(name: str):
     """Return a callable wrapper for a VCFX tool."""
-    if name in TOOL_NAMES:
-        return functools.partial(run_tool, name)
+    if name in _TOOL_NAME_SET:
+        wrapper = globals()[name] = _ToolCall(name)
+        return wrapper
     raise AttributeError(f"module 'vcfx.tools' has no attribute '{name}'")
@@ -2,50 +2,325 @@ from __future__ import annotations
 
 import subprocess
 import shutil
+import signal
 import csv
+import functools
+import io
 import os
-from typing import Any, Callable, Sequence, Type, TypeVar, get_type_hints
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Type,
+    TypeVar,
+    get_type_hints,
+)
 from dataclasses import fields as dataclass_fields
 
-# Cache for storing the list of available tools once discovered
-_TOOL_CACHE: list[str] | None = None
+T = TypeVar("T")
+
+# Cache for storing the list of available tools once discovered, together
+# with the PATH state (see :func:`_path_key`) it was discovered from
+_TOOL_CACHE: tuple[tuple[tuple[str, int], ...], list[str]] | None = None
+
+# Set view of the cached tool list for membership tests
+_TOOL_SET: frozenset[str] = frozenset()
+
+# Command prefixes (``[VCFX_<tool>]`` or ``[vcfx, <tool>]``) resolved for each
+# tool.  The cache is only valid for the ``PATH`` it was built against.
+_EXE_CACHE: dict[str, list[str]] = {}
+_EXE_CACHE_PATH: str | None = None
+
+
+# Standard stream keyword arguments and the descriptors they replace
+_STD_STREAMS = {"stdin": 0, "stdout": 1, "stderr": 2}
+
+# Signals Python ignores at startup; reset in children as subprocess'
+# ``restore_signals=True`` does, so a tool writing to a closed pipe dies
+_RESTORED_SIGNALS = tuple(
+    getattr(signal, name)
+    for name in ("SIGPIPE", "SIGXFZ", "SIGXFSZ")
+    if hasattr(signal, name)
+)
+
+# Keyword arguments that request subprocess' own text decoding
+_TEXT_OPTIONS = frozenset({"encoding", "errors", "universal_newlines"})
+
+# Keyword arguments :func:`run_tool` handles itself when capturing output
+_CAPTURE_OPTIONS = frozenset({"stdin", "input"})
+
+
+def _exe_cache() -> dict[str, list[str]]:
+    """Return the executable cache, dropping it if ``PATH`` has changed."""
+    global _EXE_CACHE_PATH
+    path = os.environ.get("PATH")
+    if path != _EXE_CACHE_PATH:
+        _EXE_CACHE.clear()
+        _EXE_CACHE_PATH = path
+    return _EXE_CACHE
+
+
+def _path_key() -> tuple[tuple[str, int], ...]:
+    """Return the ``PATH`` directories paired with their modification times.
+
+    Installing or removing a tool changes the mtime of its directory, so the
+    key changes whenever the set of reachable tools may have changed.
+    """
+    key = []
+    for path in os.environ.get("PATH", "").split(os.pathsep):
+        if not path:
+            continue
+        try:
+            key.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(key)
+
+
+def _tool_command(tool: str) -> list[str]:
+    """Return the command prefix that runs *tool*.
+
+    Raises
+    ------
+    FileNotFoundError
+        If neither ``VCFX_<tool>`` nor the ``vcfx`` wrapper is on ``PATH``.
+    """
+    cache = _exe_cache()
+    cmd = cache.get(tool)
+    if cmd is None:
+        exe = shutil.which(f"VCFX_{tool}")
+        if exe is None:
+            vcfx_wrapper = shutil.which("vcfx")
+            if vcfx_wrapper is None:
+                raise FileNotFoundError(f"VCFX tool '{tool}' not found in PATH")
+            cmd = [vcfx_wrapper, tool]
+        else:
+            cmd = [exe]
+        cache[tool] = cmd
+    return cmd
+
+
+@functools.lru_cache(maxsize=64)
+def _samples_option(
+    samples: tuple[str, ...], sep: str = " ", ordered: bool = True
+) -> tuple[str, ...]:
+    """Return the ``--samples`` arguments selecting *samples*.
+
+    Duplicate names are dropped, keeping the first occurrence, since the
+    tools would otherwise report a repeated sample twice.  Tools that treat
+    the selection as a set are called with ``ordered=False``; their names
+    are sorted so that any ordering of one sample set yields the same
+    arguments.
+
+    The result is cached, so wrappers called repeatedly with the same
+    sample set (e.g. once per chromosome) reuse one argv fragment instead
+    of joining the names again on every call.  An empty *samples* selects
+    every sample and yields no arguments.
+
+    Raises
+    ------
+    ValueError
+        If a name is empty or contains *sep*, which the tool would split on.
+    """
+    if not samples:
+        return ()
+    names = dict.fromkeys(samples)
+    for name in names:
+        if not name or sep in name:
+            raise ValueError(f"invalid sample name for --samples: {name!r}")
+    return ("--samples", sep.join(names if ordered else sorted(names)))
+
+
+def _spawn_file_actions(kwargs: Mapping[str, Any]) -> list[tuple] | None:
+    """Return :func:`os.posix_spawn` file actions for *kwargs*, if possible.
+
+    Only ``stdin``, ``stdout`` and ``stderr`` set to ``None``, a file
+    descriptor or an object with a ``fileno()`` can be honoured without
+    :mod:`subprocess`; ``None`` is returned for anything else, such as
+    ``subprocess.PIPE`` or another :func:`subprocess.run` option.
+    """
+    actions: list[tuple] = []
+    for name, value in kwargs.items():
+        target = _STD_STREAMS.get(name)
+        if target is None:
+            return None
+        if value is None:
+            continue
+        try:
+            fd = value if isinstance(value, int) else value.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+        if fd < 0:  # subprocess.PIPE, DEVNULL or STDOUT
+            return None
+        if fd != target:
+            actions.append((os.POSIX_SPAWN_DUP2, fd, target))
+    return actions
+
+
+def _spawn(
+    cmd: list[str], check: bool, file_actions: Sequence[tuple] = ()
+) -> subprocess.CompletedProcess:
+    """Run *cmd* via :func:`os.posix_spawn` and wait for it to finish.
+
+    This is the lightweight path used by :func:`run_tool` when no output is
+    captured and no :func:`subprocess.run` options other than redirections
+    of the standard streams are requested.  Signals Python ignores are
+    reset to their default disposition in the child.
+    """
+    pid = os.posix_spawn(
+        cmd[0], cmd, os.environ,
+        file_actions=file_actions, setsigdef=_RESTORED_SIGNALS,
+    )
+    try:
+        _, status = os.waitpid(pid, 0)
+    except BaseException:
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        raise
+    returncode = os.waitstatus_to_exitcode(status)
+    if check and returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    return subprocess.CompletedProcess(cmd, returncode)
+
+
+def _scan_path(key: tuple[tuple[str, int], ...]) -> dict[str, str]:
+    """Return the ``VCFX_*`` executables in the directories of *key*.
+
+    Tools are mapped to the path of their first hit in ``PATH`` order, as
+    :func:`shutil.which` would resolve them.
+    """
+    found: dict[str, str] = {}
+    seen: set[str] = set()
+    for path, _ in key:
+        if path in seen:
+            continue
+        seen.add(path)
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if not entry.name.startswith("VCFX_"):
+                        continue
+                    try:
+                        # ``is_file`` usually needs no syscall; ``stat`` is
+                        # then the only one made for each candidate.
+                        executable = (
+                            entry.is_file() and entry.stat().st_mode & 0o111
+                        )
+                    except OSError:
+                        continue
+                    if executable:
+                        found.setdefault(entry.name[5:], entry.path)
+        except OSError:
+            continue
+    return found
+
+
+def _tool_list_file() -> str:
+    """Return the file in which :func:`available_tools` stores its scan."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "vcfx", "tools.json")
+
+
+def _load_tool_list(key: tuple[tuple[str, int], ...]) -> dict[str, str] | None:
+    """Return the persisted scan result if it was made for *key*."""
+    import json
+
+    try:
+        with open(_tool_list_file(), encoding="utf-8") as fh:
+            data = json.load(fh)
+        if tuple(map(tuple, data["key"])) == key:
+            return dict(data["tools"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _store_tool_list(
+    key: tuple[tuple[str, int], ...], found: dict[str, str]
+) -> None:
+    """Persist a scan result for other interpreters; errors are ignored."""
+    import json
+
+    path = _tool_list_file()
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"key": key, "tools": found}, fh)
+        # Atomic, so concurrent interpreters never read a partial file.
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
 
 
 def available_tools(refresh: bool = False) -> list[str]:
-    """Return the list of available VCFX command line tools."""
+    """Return the list of available VCFX command line tools.
+
+    ``PATH`` is scanned in-process for executable ``VCFX_*`` files, which is
+    what ``vcfx --list`` reports, without starting a subprocess.  The
+    result is also stored in ``$XDG_CACHE_HOME/vcfx/tools.json`` (by
+    default under ``~/.cache``) together with the state of ``PATH``, so
+    that other interpreters with the same ``PATH`` can skip the scan.
+
+    Parameters
+    ----------
+    refresh : bool, optional
+        If ``True`` ignore any cached value and scan ``PATH`` again; the
+        executable locations cached by :func:`run_tool` and the stored scan
+        are replaced as well.  Defaults to ``False``.  The cached value is
+        also discarded automatically when ``PATH`` or one of its
+        directories changes.
+
+    Returns
+    -------
+    list[str]
+        Sorted names of tools discovered on ``PATH``.
+
+    Raises
+    ------
+    FileNotFoundError
+        If no tools are found and the ``vcfx`` executable cannot be found
+        either.
+    """
     global _TOOL_CACHE
-    if _TOOL_CACHE is not None and not refresh:
-        return _TOOL_CACHE
-
-    exe = shutil.which("vcfx")
-    if exe is None:
-        tools: set[str] = set()
-        for path in os.environ.get("PATH", "").split(os.pathsep):
-            if not path:
-                continue
-            try:
-                for entry in os.listdir(path):
-                    if entry.startswith("VCFX_"):
-                        full = os.path.join(path, entry)
-                        if os.path.isfile(full) and os.access(full, os.X_OK):
-                            tools.add(entry[5:])
-            except OSError:
-                continue
-        if not tools:
-            raise FileNotFoundError("vcfx wrapper not found in PATH")
-        _TOOL_CACHE = sorted(tools)
-        return _TOOL_CACHE
-
-    result = subprocess.run([exe, "--list"], capture_output=True, text=True)
-    if result.returncode != 0:
-        _TOOL_CACHE = []
-    else:
-        _TOOL_CACHE = [
-            line.strip()
-            for line in result.stdout.splitlines()
-            if line.strip()
-        ]
-    return _TOOL_CACHE
+    key = _path_key()
+    if _TOOL_CACHE is not None and not refresh and _TOOL_CACHE[0] == key:
+        return _TOOL_CACHE[1]
+
+    exe_cache = _exe_cache()
+    if refresh:
+        exe_cache.clear()
+    found = None if refresh else _load_tool_list(key)
+    if found is None:
+        found = _scan_path(key)
+        if found:
+            _store_tool_list(key, found)
+    for name, exe in found.items():
+        exe_cache.setdefault(name, [exe])
+    if not found and shutil.which("vcfx") is None:
+        raise FileNotFoundError("vcfx wrapper not found in PATH")
+    global _TOOL_SET
+    names = sorted(found)
+    _TOOL_CACHE = (key, names)
+    _TOOL_SET = frozenset(names)
+    return names
+
+
+def _is_available_tool(name: str) -> bool:
+    """Return ``True`` if *name* is listed by :func:`available_tools`."""
+    available_tools()
+    return name in _TOOL_SET
 
 
 def run_tool(
@@ -56,16 +331,89 @@ def run_tool(
     text: bool = True,
     **kwargs: Any,
 ) -> subprocess.CompletedProcess:
-    """Run a VCFX tool using :func:`subprocess.run`."""
-    exe = shutil.which(f"VCFX_{tool}")
-    cmd: list[str]
-    if exe is None:
-        vcfx_wrapper = shutil.which("vcfx")
-        if vcfx_wrapper is None:
-            raise FileNotFoundError(f"VCFX tool '{tool}' not found in PATH")
-        cmd = [vcfx_wrapper, tool, *map(str, args)]
-    else:
-        cmd = [exe, *map(str, args)]
+    """Run a VCFX tool using :func:`subprocess.run`.
+
+    If the executable ``VCFX_<tool>`` cannot be located on ``PATH`` this
+    function falls back to invoking ``vcfx <tool>`` when the ``vcfx``
+    wrapper script is available.  The resolved location is cached per tool
+    for as long as ``PATH`` is unchanged.  When output is not captured and
+    the only extra keyword arguments redirect ``stdin``, ``stdout`` or
+    ``stderr`` to open files, the tool is started directly with
+    :func:`os.posix_spawn` instead of going through :class:`subprocess.Popen`.
+
+    Tools that read a VCF from standard input can be fed a file directly by
+    passing an open binary file handle as ``stdin``; the child process then
+    reads the file descriptor itself and the data never passes through
+    Python.
+
+    Parameters
+    ----------
+    tool : str
+        Name of the tool without the ``VCFX_`` prefix.
+    *args : str
+        Command line arguments passed to the tool.
+    check : bool, optional
+        If ``True`` (default) raise ``CalledProcessError`` on a non-zero
+        exit status.
+    capture_output : bool, optional
+        Capture standard output and error and attach them to the returned
+        ``CompletedProcess``. Defaults to ``False``.
+    text : bool, optional
+        If ``True`` decode output as text. Defaults to ``True``.  Captured
+        output is decoded as UTF-8 in one step once the tool has finished;
+        ``\r\n`` line endings are not translated.  Pass ``text=False`` to
+        receive the raw bytes, e.g. to hand them to a parser directly.
+    **kwargs : Any
+        Additional keyword arguments forwarded to :func:`subprocess.run`.
+
+    Returns
+    -------
+    subprocess.CompletedProcess
+        The completed process instance for the invoked command.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the requested tool cannot be found on ``PATH``.
+    subprocess.CalledProcessError
+        If ``check`` is ``True`` and the process exits with a non-zero
+        status.
+    """
+    cmd = [*_tool_command(tool), *map(str, args)]
+    return _run(cmd, check, capture_output, text, kwargs)
+
+
+def _run(
+    cmd: list[str],
+    check: bool,
+    capture_output: bool,
+    text: bool,
+    kwargs: dict[str, Any],
+) -> subprocess.CompletedProcess:
+    """Run the fully built command line *cmd* as :func:`run_tool` does."""
+    if not capture_output and hasattr(os, "posix_spawn"):
+        # Spawning directly skips both subprocess' setup code and the fork
+        # of this (possibly large) interpreter.
+        file_actions = _spawn_file_actions(kwargs)
+        if file_actions is not None:
+            return _spawn(cmd, check, file_actions)
+    if capture_output and not _TEXT_OPTIONS.intersection(kwargs):
+        # Exchange bytes with the child and decode the output once at the
+        # end rather than going through subprocess' text-mode handling.
+        inp = kwargs.get("input")
+        if text and isinstance(inp, str):
+            kwargs["input"] = inp.encode("utf-8")
+        if _CAPTURE_OPTIONS.issuperset(kwargs):
+            # The common case for the wrappers: use Popen directly.
+            result = _capture(cmd, kwargs.get("stdin"), kwargs.get("input"))
+        else:
+            result = subprocess.run(cmd, capture_output=True, **kwargs)
+        if text:
+            result.stdout = result.stdout.decode("utf-8")
+            result.stderr = result.stderr.decode("utf-8")
+        if check:
+            result.check_returncode()
+        return result
     return subprocess.run(
         cmd,
         check=check,
@@ -75,46 +423,704 @@ def run_tool(
     )
 
 
-def _convert_fields(
-    rows: list[dict],
-    converters: dict[str, Callable[[str], Any]],
-) -> list[dict]:
-    """Apply *converters* to fields in each row in *rows*."""
-    for row in rows:
-        for key, func in converters.items():
-            if key in row:
+def _capture(
+    cmd: list[str], stdin: Any = None, input: bytes | None = None
+) -> subprocess.CompletedProcess:
+    """Run *cmd* and capture its output as bytes.
+
+    This is ``subprocess.run(cmd, capture_output=True)`` without the
+    timeout handling and argument merging that :func:`run_tool` does not
+    need.
+    """
+    if input is not None:
+        if stdin is not None:
+            raise ValueError("stdin and input arguments may not both be used.")
+        stdin = subprocess.PIPE
+    with subprocess.Popen(
+        cmd, stdin=stdin, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(input)
+        except BaseException:
+            proc.kill()
+            raise
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+class _ToolCall:
+    """Callable that runs one VCFX tool through :func:`run_tool`.
+
+    Used for tools that have no hand-written wrapper and, with preset
+    arguments placed before those of each call, by :func:`make_runner`.
+    Instances are small (``__slots__``), forward their arguments without
+    the merging done by :func:`functools.partial`, and, unlike closures,
+    can be pickled, e.g. to hand them to a
+    :class:`concurrent.futures.ProcessPoolExecutor`.
+    """
+
+    __slots__ = ("_tool", "_args")
+
+    def __init__(self, tool: str, *args: str) -> None:
+        self._tool = tool
+        self._args = tuple(map(str, args))
+
+    def __call__(
+        self,
+        *args: str,
+        check: bool = True,
+        capture_output: bool = False,
+        text: bool = True,
+        **kwargs: Any,
+    ) -> subprocess.CompletedProcess:
+        cmd = [*_tool_command(self._tool), *self._args, *map(str, args)]
+        return _run(cmd, check, capture_output, text, kwargs)
+
+    def __reduce__(self) -> tuple[type, tuple[str, ...]]:
+        return (_ToolCall, (self._tool, *self._args))
+
+    def __repr__(self) -> str:
+        if self._args:
+            return f"<vcfx tool {self._tool!r} {' '.join(self._args)}>"
+        return f"<vcfx tool {self._tool!r}>"
+
+    @property
+    def __name__(self) -> str:
+        return self._tool
+
+
+def make_runner(
+    tool: str, *args: str
+) -> Callable[..., subprocess.CompletedProcess]:
+    """Return a callable that runs *tool* with *args* preset.
+
+    The preset arguments are converted to strings once, so a runner
+    called in a loop only builds the command line from the cached
+    executable, the preset arguments and the arguments of each call.
+
+    Parameters
+    ----------
+    tool : str
+        Name of the tool without the ``VCFX_`` prefix.
+    *args : str
+        Command line arguments passed to the tool on every call.
+
+    Returns
+    -------
+    Callable[..., subprocess.CompletedProcess]
+        A picklable callable accepting further arguments and the keyword
+        arguments of :func:`run_tool`.
+
+    Examples
+    --------
+    >>> count = make_runner("variant_counter", "--strict")
+    >>> for path in files:  # doctest: +SKIP
+    ...     with open(path, "rb") as fh:
+    ...         print(count(stdin=fh, capture_output=True).stdout)
+    """
+    return _ToolCall(tool, *args)
+
+
+def run_tool_stream(
+    tool: str,
+    *args: str,
+    row_cls: Type[T] | None = None,
+    delimiter: str = "\t",
+    buffer_size: int = 128 * 1024,
+    check: bool = True,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """Run a VCFX tool and iterate over its output rows as they arrive.
+
+    Unlike ``run_tool(..., capture_output=True)`` the output is never held
+    in memory as a whole; it is read from a pipe in chunks of
+    *buffer_size* bytes and parsed line by line.
+
+    Parameters
+    ----------
+    tool : str
+        Name of the tool without the ``VCFX_`` prefix.
+    *args : str
+        Command line arguments passed to the tool.
+    row_cls : Type[T] | None, optional
+        Dataclass to build for each row.  The first line of output is then
+        treated as a header naming the fields, and ``int``/``float`` fields
+        are converted as in :func:`_tsv_to_dataclasses`.  If ``None``
+        (default) each line, including any header, is yielded as a list of
+        strings.
+    delimiter : str, optional
+        Field separator. Defaults to a tab.
+    buffer_size : int, optional
+        Size of the read buffer in bytes. Defaults to 128 KiB.
+    check : bool, optional
+        If ``True`` (default) raise ``CalledProcessError`` once the output
+        is exhausted if the process exited with a non-zero status.
+    **kwargs : Any
+        Additional keyword arguments forwarded to
+        :class:`subprocess.Popen`, e.g. ``stdin``.
+
+    Yields
+    ------
+    T or list[str]
+        One item per non-empty output line.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the requested tool cannot be found on ``PATH``.
+    subprocess.CalledProcessError
+        If ``check`` is ``True`` and the process exits with a non-zero
+        status.
+    """
+    cmd = [*_tool_command(tool), *map(str, args)]
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, bufsize=buffer_size, **kwargs
+    )
+    assert proc.stdout is not None
+    finished = False
+    try:
+        lines = io.TextIOWrapper(proc.stdout, encoding="utf-8")
+        build: Callable[[list[str]], Any] | None = None
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            values = line.split(delimiter)
+            if row_cls is None:
+                yield values
+            elif build is None:
+                build = _row_builder(
+                    row_cls, values, _default_converters(row_cls)
+                )
+            else:
+                yield build(values)
+        finished = True
+    finally:
+        if not finished:
+            # Stopped early: the remaining output is of no interest.
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+    if check and proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def run_pipeline(
+    stages: Sequence[tuple[str, Sequence[str]]],
+    vcf_file: str | os.PathLike[str],
+    text: bool = True,
+    buffer_size: int = 128 * 1024,
+    check: bool = True,
+) -> Iterator[Any]:
+    """Chain VCFX tools and iterate over the output of the last one.
+
+    The stages are connected through pipes as in a shell pipeline: the
+    first tool reads *vcf_file* as its standard input and each following
+    tool reads the output of the previous one.  All tools run
+    concurrently and no intermediate output is held in Python.
+
+    Parameters
+    ----------
+    stages : Sequence[tuple[str, Sequence[str]]]
+        ``(tool, args)`` pairs giving each tool name without the ``VCFX_``
+        prefix and its command line arguments.
+    vcf_file : str or os.PathLike
+        Path to the VCF passed to the first tool.
+    text : bool, optional
+        If ``True`` (default) yield lines decoded as UTF-8, otherwise
+        yield them as bytes.  Lines keep their line endings.
+    buffer_size : int, optional
+        Size of the read buffer in bytes. Defaults to 128 KiB.
+    check : bool, optional
+        If ``True`` (default) raise ``CalledProcessError`` once the output
+        is exhausted if any tool exited with a non-zero status.
+
+    Yields
+    ------
+    str or bytes
+        The output lines of the last tool.
+
+    Raises
+    ------
+    ValueError
+        If *stages* is empty.
+    FileNotFoundError
+        If one of the tools cannot be found on ``PATH``.
+    subprocess.CalledProcessError
+        If ``check`` is ``True`` and a tool exits with a non-zero status.
+    """
+    if not stages:
+        raise ValueError("run_pipeline() requires at least one stage")
+    cmds = [[*_tool_command(tool), *map(str, args)] for tool, args in stages]
+    procs: list[subprocess.Popen] = []
+    finished = False
+    try:
+        with open(vcf_file, "rb") as fh:
+            stdin: Any = fh
+            for cmd in cmds:
+                proc = subprocess.Popen(
+                    cmd, stdin=stdin, stdout=subprocess.PIPE, bufsize=buffer_size
+                )
+                if procs:
+                    # Only the next stage holds the pipe now, so the previous
+                    # one receives SIGPIPE if that stage exits early.
+                    stdin.close()
+                procs.append(proc)
+                stdin = proc.stdout
+        out = procs[-1].stdout
+        assert out is not None
+        if text:
+            yield from io.TextIOWrapper(out, encoding="utf-8")
+        else:
+            yield from out
+        finished = True
+    finally:
+        for proc in procs:
+            if not finished:
+                # Stopped early: the remaining output is of no interest.
+                proc.kill()
+            if proc.stdout is not None:
+                proc.stdout.close()
+            proc.wait()
+    if check:
+        last = len(procs) - 1
+        for i, proc in enumerate(procs):
+            # An upstream tool is killed by SIGPIPE when a later one stops
+            # reading; as in a shell pipeline that is not an error.
+            if proc.returncode and not (
+                i < last and proc.returncode == -signal.SIGPIPE
+            ):
+                raise subprocess.CalledProcessError(proc.returncode, cmds[i])
+
+
+async def run_tool_async(
+    tool: str,
+    *args: str,
+    stdin_path: str | os.PathLike[str] | None = None,
+    check: bool = True,
+    text: bool = True,
+) -> subprocess.CompletedProcess:
+    """Run a VCFX tool as an :mod:`asyncio` subprocess and capture its output.
+
+    This is the asynchronous counterpart of
+    ``run_tool(..., capture_output=True)``: while the tool runs, the event
+    loop is free to start and serve other tools, so independent
+    invocations overlap.
+
+    Parameters
+    ----------
+    tool : str
+        Name of the tool without the ``VCFX_`` prefix.
+    *args : str
+        Command line arguments passed to the tool.
+    stdin_path : str or os.PathLike, optional
+        File passed to the tool as its standard input.  If ``None``
+        (default) the tool reads from an empty input.
+    check : bool, optional
+        If ``True`` (default) raise ``CalledProcessError`` on a non-zero
+        exit status.
+    text : bool, optional
+        If ``True`` (default) decode the output as UTF-8.
+
+    Returns
+    -------
+    subprocess.CompletedProcess
+        The completed process with ``stdout`` and ``stderr`` set.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the requested tool cannot be found on ``PATH``.
+    subprocess.CalledProcessError
+        If ``check`` is ``True`` and the process exits with a non-zero
+        status.
+    """
+    import asyncio
+
+    cmd = [*_tool_command(tool), *map(str, args)]
+    if stdin_path is None:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    else:
+        with open(stdin_path, "rb") as fh:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdin=fh, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+    try:
+        stdout, stderr = await proc.communicate()
+        returncode = await proc.wait()
+    except BaseException:
+        # Cancelled: do not leave the tool running.
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    result = subprocess.CompletedProcess(
+        cmd,
+        returncode,
+        stdout.decode("utf-8") if text else stdout,
+        stderr.decode("utf-8") if text else stderr,
+    )
+    if check:
+        result.check_returncode()
+    return result
+
+
+async def run_many(
+    jobs: Iterable[Sequence[Any]],
+    limit: int | None = None,
+    check: bool = True,
+    text: bool = True,
+) -> list[subprocess.CompletedProcess]:
+    """Run independent VCFX tool invocations concurrently.
+
+    Parameters
+    ----------
+    jobs : Iterable[Sequence]
+        ``(tool, args)`` or ``(tool, args, stdin_path)`` tuples, as passed
+        to :func:`run_tool_async`.
+    limit : int, optional
+        Maximum number of tools running at the same time.  Defaults to the
+        number of CPUs.
+    check : bool, optional
+        If ``True`` (default) raise ``CalledProcessError`` if any tool exits
+        with a non-zero status.
+    text : bool, optional
+        If ``True`` (default) decode the output as UTF-8.
+
+    Returns
+    -------
+    list[subprocess.CompletedProcess]
+        One completed process per job, in the order of *jobs*.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> jobs = [("variant_counter", [], f"chr{c}.vcf") for c in (1, 2, 3)]
+    >>> results = asyncio.run(run_many(jobs))  # doctest: +SKIP
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(limit or os.cpu_count() or 1)
+
+    async def run(job: Sequence[Any]) -> subprocess.CompletedProcess:
+        tool, args, *rest = job
+        async with semaphore:
+            return await run_tool_async(
+                tool, *args, stdin_path=rest[0] if rest else None,
+                check=check, text=text,
+            )
+
+    return list(await asyncio.gather(*(run(job) for job in jobs)))
+
+
+# Converters derived from the type hints of each result dataclass
+_CONVERTER_CACHE: dict[type, Mapping[str, Callable[[str], Any]]] = {}
+
+
+def _default_converters(cls: type) -> Mapping[str, Callable[[str], Any]]:
+    """Return converters for the ``int`` and ``float`` fields of *cls*.
+
+    The result is cached per class so that type hints are only resolved
+    once.
+    """
+    cached = _CONVERTER_CACHE.get(cls)
+    if cached is not None:
+        return cached
+    converters: dict[str, Callable[[str], Any]] = {}
+    hints = get_type_hints(cls)
+    for f in dataclass_fields(cls):
+        ftype = hints.get(f.name, f.type)
+        if ftype is int:
+            converters[f.name] = int
+        elif ftype is float:
+            converters[f.name] = float
+    cached = _CONVERTER_CACHE[cls] = MappingProxyType(converters)
+    return cached
+
+
+def _row_builder(
+    cls: Type[T],
+    header: Sequence[str],
+    converters: Mapping[str, Callable[[str], Any]],
+) -> Callable[[list[Any]], T]:
+    """Return a function turning a list of field values into a *cls*.
+
+    Converters are looked up by column once, up front.  Values that fail
+    to convert become ``nan``.  Fields missing from a short row are
+    ``None``, as :class:`csv.DictReader` would fill them; a row with more
+    values than *header* raises :class:`ValueError`.  When *header* lists
+    the fields of *cls* in declaration order the instance is built
+    positionally, avoiding a per-row dict.
+    """
+    header = list(header)
+    width = len(header)
+    convs = [
+        (i, converters[name])
+        for i, name in enumerate(header)
+        if name in converters
+    ]
+    positional = header == [
+        f.name for f in dataclass_fields(cls)  # type: ignore[arg-type]
+    ]
+
+    def build(values: list[Any]) -> T:
+        count = len(values)
+        if count != width:
+            if count > width:
+                raise ValueError(
+                    f"expected {width} tab separated fields, got {count}: "
+                    f"{values!r}"
+                )
+            values.extend([None] * (width - count))
+        for i, func in convs:
+            if i < count:
                 try:
-                    row[key] = func(row[key])
+                    values[i] = func(values[i])
                 except ValueError:
-                    row[key] = float("nan")
-    return rows
+                    values[i] = float("nan")
+        if positional:
+            return cls(*values)
+        return cls(**dict(zip(header, values)))
 
+    return build
 
-T = TypeVar("T")
+
+def _run_parsed(
+    tool: str,
+    args: Sequence[str],
+    parse: Callable[[Iterable[str]], T],
+    vcf_file: str | os.PathLike[str] | None = None,
+) -> T:
+    """Run *tool* and hand its output lines to *parse* as they are read.
+
+    This is ``run_tool(..., capture_output=True)`` without holding the
+    whole output in memory: *parse* consumes the standard output pipe
+    line by line while the tool is still running.  If *vcf_file* is given
+    it is passed to the tool as its standard input.  Standard error is
+    spooled to a temporary file and attached to the
+    :class:`subprocess.CalledProcessError` raised when the tool fails.
+    """
+    import tempfile
+
+    cmd = [*_tool_command(tool), *map(str, args)]
+    with tempfile.TemporaryFile() as err:
+        if vcf_file is None:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err)
+        else:
+            with open(vcf_file, "rb") as fh:
+                proc = subprocess.Popen(
+                    cmd, stdin=fh, stdout=subprocess.PIPE, stderr=err
+                )
+        with proc:
+            assert proc.stdout is not None
+            lines = io.TextIOWrapper(proc.stdout, encoding="utf-8", newline="")
+            try:
+                result = parse(lines)
+            except Exception as exc:
+                lines.close()
+                if proc.wait() > 0:
+                    raise _called_process_error(proc, cmd, err) from exc
+                raise
+        if proc.returncode:
+            raise _called_process_error(proc, cmd, err)
+    return result
+
+
+def _called_process_error(
+    proc: subprocess.Popen, cmd: list[str], err: IO[bytes]
+) -> subprocess.CalledProcessError:
+    """Return the error for a failed *proc* whose stderr was spooled to *err*."""
+    err.seek(0)
+    stderr = err.read().decode("utf-8", "replace")
+    return subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
 
 
 def _tsv_to_dataclasses(
-    text: str,
+    text: str | Iterable[str],
     cls: Type[T],
-    converters: dict[str, Callable[[str], Any]] | None = None,
+    converters: Mapping[str, Callable[[str], Any]] | None = None,
     fieldnames: Sequence[str] | None = None,
 ) -> list[T]:
-    """Parse TSV *text* into instances of *cls*."""
-    lines = [ln for ln in text.splitlines() if ln.strip()]
-    reader = csv.DictReader(lines, delimiter="\t", fieldnames=fieldnames)
-    rows = list(reader)
+    """Parse TSV *text* into instances of *cls*.
+
+    If *converters* is not provided, the field types defined on ``cls``
+    are used to cast values (``int`` and ``float``). Custom converters may
+    be supplied to override this behaviour.
+
+    Parameters
+    ----------
+    text : str | Iterable[str]
+        TSV formatted text to parse, or an iterable of its lines.
+    cls : Type[T]
+        Dataclass type to instantiate for each row.
+    converters : Mapping[str, Callable[[str], Any]] | None, optional
+        Optional mapping of field names to converter functions.
+    fieldnames : Sequence[str] | None, optional
+        Explicit field names when *text* has no header row.
+    """
+
+    if isinstance(text, str):
+        text = text.splitlines()
+    reader = csv.reader((ln for ln in text if ln.strip()), delimiter="\t")
+    header = fieldnames if fieldnames is not None else next(reader, None)
+    if header is None:
+        return []
 
     if converters is None:
-        converters = {}
-        hints = get_type_hints(cls)
-        for f in dataclass_fields(cls):  # type: ignore[arg-type]
-            ftype = hints.get(f.name, f.type)
-            if ftype is int:
-                converters[f.name] = int
-            elif ftype is float:
-                converters[f.name] = float
-
-    if converters:
-        _convert_fields(rows, converters)
-
-    return [cls(**row) for row in rows]
+        converters = _default_converters(cls)
+
+    build = _row_builder(cls, header, converters)
+    return [build(values) for values in reader]
+
+
+def _tsv_to_dicts(
+    text: str | Iterable[str], columnar: bool = False
+) -> list[dict[str, Any]] | dict[str, list[Any]]:
+    """Parse TSV *text* with a header row into dictionaries.
+
+    Rows are returned as with :class:`csv.DictReader`: missing trailing
+    fields are ``None`` and surplus fields are collected in a list under
+    the key ``None``.  The header is read once and each row is zipped
+    with it, instead of building every row through ``DictReader``.
+
+    Parameters
+    ----------
+    text : str | Iterable[str]
+        TSV formatted text to parse, or an iterable of its lines.
+    columnar : bool, optional
+        If ``True`` return one list of values per column instead of one
+        dictionary per row. Defaults to ``False``.
+    """
+    if isinstance(text, str):
+        text = text.splitlines()
+    reader = csv.reader(text, delimiter="\t")
+    header = next(reader, None)
+    if header is None:
+        return {} if columnar else []
+    width = len(header)
+    if columnar:
+        columns: list[list[Any]] = [[] for _ in header]
+        for row in reader:
+            if not row:
+                continue
+            for column, value in zip(columns, row):
+                column.append(value)
+            for column in columns[len(row):]:
+                column.append(None)
+        return dict(zip(header, columns))
+
+    rows: list[dict[str, Any]] = []
+    for row in reader:
+        if not row:
+            continue
+        record: dict[Any, Any] = dict(zip(header, row))
+        if len(row) < width:
+            for name in header[len(row):]:
+                record[name] = None
+        elif len(row) > width:
+            record[None] = row[width:]
+        rows.append(record)
+    return rows
+
+
+# Wrapper results memoized by :func:`_memoize_vcf`, least recently used
+# first.  Memoization is disabled while the size limit is 0.
+_RESULT_CACHE: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+_RESULT_CACHE_SIZE = 0
+
+# Marks a cache miss, since ``None`` may be a memoized result
+_MISSING = object()
+
+
+def set_cache_size(maxsize: int) -> None:
+    """Memoize the results of deterministic wrappers.
+
+    Wrappers such as :func:`vcfx.allele_freq_calc` then return the parsed
+    result of an earlier call with the same arguments instead of running
+    the tool again, as long as the input file's modification time and size
+    are unchanged.  Memoization is disabled by default.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of results kept; the least recently used result is
+        dropped first.  ``0`` disables memoization and clears the cache.
+    """
+    global _RESULT_CACHE_SIZE
+    if maxsize < 0:
+        raise ValueError("maxsize must not be negative")
+    _RESULT_CACHE_SIZE = maxsize
+    while len(_RESULT_CACHE) > maxsize:
+        _RESULT_CACHE.popitem(last=False)
+
+
+def clear_cache() -> None:
+    """Drop all results memoized since :func:`set_cache_size` was called."""
+    _RESULT_CACHE.clear()
+
+
+def _freeze(value: Any) -> Any:
+    """Return *value* with lists turned into tuples, for use in a key."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _copy_result(value: Any) -> Any:
+    """Return a copy of a memoized result that callers may modify.
+
+    Lists and dicts of columns (lists or NumPy arrays) are copied, as are
+    row dictionaries.  The frozen :mod:`vcfx.results` rows and scalars are
+    immutable and shared.
+    """
+    if isinstance(value, list):
+        if value and isinstance(value[0], dict):
+            return [dict(row) for row in value]
+        return list(value)
+    if isinstance(value, dict):
+        return {
+            name: column.copy() if hasattr(column, "copy") else column
+            for name, column in value.items()
+        }
+    return value
+
+
+def _memoize_vcf(func: Callable[..., T]) -> Callable[..., T]:
+    """Memoize *func*, whose first argument is a VCF path, when enabled.
+
+    The key combines the function, its arguments and the ``st_mtime_ns``
+    and ``st_size`` of the file, so a rewritten file is processed again.
+    List arguments are keyed as tuples; calls with other unhashable
+    arguments are not memoized.  Every call returns its own copy of a
+    memoized list or dict (see :func:`_copy_result`).
+    """
+
+    @functools.wraps(func)
+    def wrapper(vcf_file: Any, *args: Any, **kwargs: Any) -> T:
+        if not _RESULT_CACHE_SIZE:
+            return func(vcf_file, *args, **kwargs)
+        try:
+            path = os.path.abspath(vcf_file)
+            st = os.stat(path)
+            key = (
+                func,
+                path,
+                st.st_mtime_ns,
+                st.st_size,
+                tuple(map(_freeze, args)),
+                frozenset((name, _freeze(v)) for name, v in kwargs.items()),
+            )
+            value = _RESULT_CACHE.get(key, _MISSING)
+        except (OSError, TypeError):
+            return func(vcf_file, *args, **kwargs)
+        if value is _MISSING:
+            value = _RESULT_CACHE[key] = func(vcf_file, *args, **kwargs)
+            if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+                _RESULT_CACHE.popitem(last=False)
+        else:
+            _RESULT_CACHE.move_to_end(key)
+        return _copy_result(value)
+
+    return wrapper
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from typing import Sequence
-import csv
 
-from .base import run_tool
+from .base import _run_parsed, _samples_option, _tsv_to_dicts, run_tool
 
 __all__ = [
     "ld_calculator",
@@ -38,16 +37,14 @@ def ld_calculator(vcf_file: str, region: str | None = None) -> str:
     if region:
         args.extend(["--region", region])
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "ld_calculator",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "ld_calculator",
+            *args,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -70,15 +67,13 @@ def merger(vcf_files: Sequence[str]) -> str:
 def metadata_summarizer(vcf_file: str) -> str:
     """Summarize metadata from a VCF file."""
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "metadata_summarizer",
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "metadata_summarizer",
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -95,16 +90,14 @@ def missing_data_handler(
         args.append("--fill-missing")
         args.extend(["--default-genotype", default_genotype])
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "missing_data_handler",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "missing_data_handler",
+            *args,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -112,15 +105,13 @@ def missing_data_handler(
 def multiallelic_splitter(vcf_file: str) -> str:
     """Split multi-allelic variants into bi-allelic records."""
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "multiallelic_splitter",
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "multiallelic_splitter",
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -128,15 +119,13 @@ def multiallelic_splitter(vcf_file: str) -> str:
 def nonref_filter(vcf_file: str) -> str:
     """Remove homozygous reference variants."""
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "nonref_filter",
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "nonref_filter",
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -146,8 +135,13 @@ def outlier_detector(
     metric: str,
     threshold: float,
     mode: str = "variant",
-) -> list[dict]:
-    """Detect variant or sample outliers based on metrics."""
+    columnar: bool = False,
+) -> list[dict] | dict[str, list]:
+    """Detect variant or sample outliers based on metrics.
+
+    If *columnar* is ``True`` a dictionary mapping each column to its list
+    of values is returned instead of one dictionary per row.
+    """
 
     args = ["--metric", metric, "--threshold", str(threshold)]
     if mode == "variant":
@@ -155,33 +149,24 @@ def outlier_detector(
     else:
         args.append("--sample")
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
+    return _run_parsed(
         "outlier_detector",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
+        args,
+        lambda lines: _tsv_to_dicts(lines, columnar),
+        vcf_file,
     )
 
-    reader = csv.DictReader(result.stdout.splitlines(), delimiter="\t")
-    return list(reader)
-
 
 def phase_checker(vcf_file: str) -> str:
     """Keep only fully phased variants."""
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "phase_checker",
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "phase_checker",
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -189,17 +174,15 @@ def phase_checker(vcf_file: str) -> str:
 def phase_quality_filter(vcf_file: str, condition: str) -> str:
     """Filter variants by phase quality."""
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "phase_quality_filter",
-        "--filter-pq",
-        condition,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "phase_quality_filter",
+            "--filter-pq",
+            condition,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -215,16 +198,14 @@ def phred_filter(
     if keep_missing_qual:
         args.append("--keep-missing-qual")
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "phred_filter",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "phred_filter",
+            *args,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -232,19 +213,17 @@ def phred_filter(
 def population_filter(vcf_file: str, pop_tag: str, pop_map: str) -> str:
     """Subset samples by population."""
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "population_filter",
-        "--population",
-        pop_tag,
-        "--pop-map",
-        pop_map,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "population_filter",
+            "--population",
+            pop_tag,
+            "--pop-map",
+            pop_map,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -252,17 +231,15 @@ def population_filter(vcf_file: str, pop_tag: str, pop_map: str) -> str:
 def position_subsetter(vcf_file: str, region: str) -> str:
     """Extract variants within a genomic region."""
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "position_subsetter",
-        "--region",
-        region,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "position_subsetter",
+            "--region",
+            region,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -270,17 +247,15 @@ def position_subsetter(vcf_file: str, region: str) -> str:
 def probability_filter(vcf_file: str, condition: str) -> str:
     """Filter variants by genotype probability values."""
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "probability_filter",
-        "--filter-probability",
-        condition,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "probability_filter",
+            "--filter-probability",
+            condition,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -296,16 +271,14 @@ def quality_adjuster(
     if no_clamp:
         args.append("--no-clamp")
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "quality_adjuster",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "quality_adjuster",
+            *args,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -313,17 +286,15 @@ def quality_adjuster(
 def ref_comparator(vcf_file: str, reference: str) -> str:
     """Compare variant alleles against a reference genome."""
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "ref_comparator",
-        "--reference",
-        reference,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "ref_comparator",
+            "--reference",
+            reference,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -347,16 +318,14 @@ def reformatter(
     if reorder_format:
         args.extend(["--reorder-format", ",".join(reorder_format)])
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "reformatter",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "reformatter",
+            *args,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -364,36 +333,40 @@ def reformatter(
 def region_subsampler(vcf_file: str, bed_file: str) -> str:
     """Subset variants based on a BED file of regions."""
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "region_subsampler",
-        "--region-bed",
-        bed_file,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "region_subsampler",
+            "--region-bed",
+            bed_file,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
 
 def sample_extractor(vcf_file: str, samples: Sequence[str]) -> str:
-    """Extract a subset of samples from a VCF."""
-
-    args = ["--samples", " ".join(samples)]
-
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "sample_extractor",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    """Extract a subset of samples from a VCF.
+
+    Raises
+    ------
+    ValueError
+        If *samples* is empty; the tool needs at least one sample.
+    """
+
+    if not samples:
+        raise ValueError("sample_extractor needs at least one sample")
+    args = _samples_option(tuple(samples))
+
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "sample_extractor",
+            *args,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -405,16 +378,14 @@ def sorter(vcf_file: str, natural_chr: bool = False) -> str:
     if natural_chr:
         args.append("--natural-chr")
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "sorter",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "sorter",
+            *args,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -426,16 +397,14 @@ def subsampler(vcf_file: str, n: int, seed: int | None = None) -> str:
     if seed is not None:
         args.extend(["--seed", str(seed)])
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "subsampler",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "subsampler",
+            *args,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -453,16 +422,14 @@ def sv_handler(
     if sv_modify:
         args.append("--sv-modify")
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "sv_handler",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "sv_handler",
+            *args,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
 
@@ -480,15 +447,13 @@ def validator(
     if report_dups:
         args.append("--report-dups")
 
-    with open(vcf_file, "r", encoding="utf-8") as fh:
-        inp = fh.read()
-
-    result = run_tool(
-        "validator",
-        *args,
-        capture_output=True,
-        text=True,
-        input=inp,
-    )
+    with open(vcf_file, "rb") as fh:
+        result = run_tool(
+            "validator",
+            *args,
+            capture_output=True,
+            text=True,
+            stdin=fh,
+        )
 
     return result.stdout
@@ -10,17 +10,35 @@ This script handles:
 """
 
 import argparse
+import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a command and handle errors."""
+def run_command(cmd, cwd=None, check=True, stream=False):
+    """Run a command and handle errors.
+
+    With ``stream=True`` the command writes straight to this process'
+    stdout and stderr, so long builds and uploads report progress as it
+    happens instead of being buffered until they finish.
+    """
     print(f"Running: {' '.join(cmd)}")
+    # Descriptors opened by Python are non-inheritable (PEP 446), so there is
+    # nothing for the child to close; close_fds=False lets subprocess skip
+    # that step and use posix_spawn where available.
+    if stream:
+        result = subprocess.run(cmd, cwd=cwd, close_fds=False)
+        if check and result.returncode:
+            print(f"Error running command: exit status {result.returncode}")
+            sys.exit(1)
+        return result
     try:
         result = subprocess.run(
-            cmd, cwd=cwd, check=check, capture_output=True, text=True
+            cmd, cwd=cwd, check=check, capture_output=True, text=True,
+            close_fds=False,
         )
         if result.stdout:
             print(result.stdout)
@@ -37,17 +55,25 @@ def run_command(cmd, cwd=None, check=True):
 def clean_build_dirs():
     """Clean previous build artifacts."""
     python_dir = Path(__file__).parent.parent / "python"
-    dirs_to_clean = ["build", "dist", "*.egg-info"]
 
-    for pattern in dirs_to_clean:
-        for path in python_dir.glob(pattern):
-            if path.is_dir():
-                print(f"Removing {path}")
-                import shutil
-                shutil.rmtree(path)
-            elif path.is_file():
-                print(f"Removing {path}")
-                path.unlink()
+    # One directory scan matching build/, dist/ and *.egg-info together
+    targets = []
+    with os.scandir(python_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name in ("build", "dist") or name.endswith(".egg-info"):
+                targets.append(entry)
+
+    def remove(entry):
+        print(f"Removing {entry.path}")
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+    # The trees are independent, so delete them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(remove, targets))
 
 
 def build_package():
@@ -55,7 +81,7 @@ def build_package():
     python_dir = Path(__file__).parent.parent / "python"
 
     print("Building package...")
-    run_command([sys.executable, "-m", "build"], cwd=python_dir)
+    run_command([sys.executable, "-m", "build"], cwd=python_dir, stream=True)
 
     # Check if dist directory was created
     dist_dir = python_dir / "dist"
@@ -81,7 +107,7 @@ def publish_to_testpypi(dist_dir):
         sys.executable, "-m", "twine", "upload",
         "--repository", "testpypi",
         str(dist_dir / "*")
-    ])
+    ], stream=True)
 
 
 def publish_to_pypi(dist_dir):
@@ -90,7 +116,7 @@ def publish_to_pypi(dist_dir):
     run_command([
         sys.executable, "-m", "twine", "upload",
         str(dist_dir / "*")
-    ])
+    ], stream=True)
 
 
 def main():
@@ -112,6 +138,10 @@ def main():
         "--dry-run", action="store_true",
         help="Build and check but don't publish"
     )
+    parser.add_argument(
+        "--yes", "--no-confirm", action="store_true",
+        help="Publish to PyPI without asking for confirmation"
+    )
 
     args = parser.parse_args()
 
@@ -140,9 +170,17 @@ def main():
     if args.test:
         publish_to_testpypi(dist_dir)
     else:
-        # Confirm before publishing to PyPI
-        response = input("Publish to PyPI? This cannot be undone. (y/N): ")
-        if response.lower() == 'y':
+        # Confirm before publishing to PyPI, unless --yes was given.  Without
+        # a terminal to ask on, refuse rather than block on input().
+        if args.yes:
+            confirmed = True
+        elif sys.stdin.isatty():
+            response = input("Publish to PyPI? This cannot be undone. (y/N): ")
+            confirmed = response.lower() == 'y'
+        else:
+            print("Not a terminal; pass --yes to publish without confirmation.")
+            confirmed = False
+        if confirmed:
             publish_to_pypi(dist_dir)
         else:
             print("Aborted.")
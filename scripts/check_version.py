@@ -4,25 +4,45 @@ from __future__ import annotations
 import re
 import sys
 from pathlib import Path
-try:
-    import tomllib  # Python 3.11+
-except ModuleNotFoundError:  # pragma: no cover - Python 3.10 fallback
-    import tomli as tomllib
+try:  # pragma: no cover - optional native parser
+    import toml_rs as tomllib  # type: ignore
+except ModuleNotFoundError:
+    try:
+        import tomllib  # Python 3.11+
+    except ModuleNotFoundError:  # pragma: no cover - Python 3.10 fallback
+        import tomli as tomllib
 
 from extract_version import extract_version
 
 
 def parse_citation(path: Path) -> str:
-    text = path.read_text()
-    match = re.search(r"^version:\s*\"?([^\"]+)\"?", text, re.MULTILINE)
-    if not match:
-        raise RuntimeError(f"Unable to find version in {path}")
-    return match.group(1).strip()
+    # Stop at the top-level ``version:`` key instead of searching the whole
+    # file; nested keys are indented and never match.
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            if line.startswith("version:"):
+                value = line[len("version:"):].strip()
+                version = value.strip('"').split('"', 1)[0].strip()
+                if version:
+                    return version
+    raise RuntimeError(f"Unable to find version in {path}")
+
+
+# ``dynamic = [..., "version", ...]`` and any line assigning a version
+_DYNAMIC_VERSION_RE = re.compile(
+    rb"^\s*dynamic\s*=\s*\[[^\]]*[\"']version[\"']", re.MULTILINE
+)
+_VERSION_KEY_RE = re.compile(rb"^\s*version\s*=", re.MULTILINE)
 
 
 def parse_pyproject(path: Path, cmake_version: str) -> str:
-    with path.open("rb") as f:
-        data = tomllib.load(f)
+    raw = path.read_bytes()
+    # A version declared dynamic, with no version key anywhere in the file,
+    # always comes from CMakeLists.txt; only parse the TOML when unsure.
+    if _DYNAMIC_VERSION_RE.search(raw) and not _VERSION_KEY_RE.search(raw):
+        return cmake_version
+    # ``loads`` is the one entry point shared by all three parsers.
+    data = tomllib.loads(raw.decode("utf-8"))
     project = data.get("project", {})
     if "version" in project:
         return str(project["version"])  # explicit version
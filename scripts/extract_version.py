@@ -1,25 +1,63 @@
 #!/usr/bin/env python3
+import functools
+import os
 import re
 from pathlib import Path
-from typing import Union, Optional
+from typing import Dict, Optional, Union
+
+
+_VERSION_RE = re.compile(
+    rb"set\(\s*VCFX_VERSION(?:_(MAJOR|MINOR|PATCH)\s+(\d+)"
+    rb"|\s+\"([0-9]+\.[0-9]+\.[0-9]+)\")\s*\)"
+)
+
+# ``project(<name> VERSION x.y.z ...)``, possibly spanning several lines
+_PROJECT_RE = re.compile(rb"^\s*project\s*\(", re.IGNORECASE)
+_PROJECT_VERSION_RE = re.compile(rb"\bVERSION\s+([0-9]+\.[0-9]+\.[0-9]+)\b")
 
 
 def extract_version(cmake_path: Optional[Union[Path, str]] = None) -> str:
     """Return the toolkit version as defined in CMakeLists.txt."""
     if cmake_path is None:
         cmake_path = Path(__file__).resolve().parents[1] / "CMakeLists.txt"
-    cmake_text = Path(cmake_path).read_text()
-    major = re.search(r"set\(\s*VCFX_VERSION_MAJOR\s+(\d+)\s*\)", cmake_text)
-    minor = re.search(r"set\(\s*VCFX_VERSION_MINOR\s+(\d+)\s*\)", cmake_text)
-    patch = re.search(r"set\(\s*VCFX_VERSION_PATCH\s+(\d+)\s*\)", cmake_text)
-    if major and minor and patch:
-        return f"{major.group(1)}.{minor.group(1)}.{patch.group(1)}"
-    version = re.search(
-        r"set\(\s*VCFX_VERSION\s+\"([0-9]+\.[0-9]+\.[0-9]+)\"\s*\)",
-        cmake_text,
-    )
-    if version:
-        return version.group(1)
+    path = os.path.abspath(cmake_path)
+    # The modification time is part of the cache key, so an edited file is
+    # parsed again while repeated lookups of an unchanged one are free.
+    return _parse_version(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_version(cmake_path: str, mtime_ns: int) -> str:
+    """Parse the version from *cmake_path* as of modification *mtime_ns*."""
+    parts: Dict[bytes, bytes] = {}
+    version = None
+    project_version = None
+    in_project = False
+    # Single pass over the file, stopping as soon as all three components
+    # have been seen (they are normally defined at the very top).
+    with open(cmake_path, "rb") as fh:
+        for line in fh:
+            if in_project or _PROJECT_RE.match(line):
+                match = _PROJECT_VERSION_RE.search(line)
+                if match and project_version is None:
+                    project_version = match.group(1)
+                in_project = b")" not in line
+            if b"VCFX_VERSION" not in line:
+                continue
+            for match in _VERSION_RE.finditer(line):
+                component, number, full = match.groups()
+                if component is not None:
+                    parts.setdefault(component, number)
+                elif version is None:
+                    version = full
+            if len(parts) == 3:
+                return ".".join(
+                    parts[c].decode() for c in (b"MAJOR", b"MINOR", b"PATCH")
+                )
+    if version is not None:
+        return version.decode()
+    if project_version is not None:
+        return project_version.decode()
     raise RuntimeError("Unable to parse version from CMakeLists.txt")
 
 
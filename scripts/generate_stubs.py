@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Generate ``python/__init__.pyi`` for the lazily populated ``vcfx`` package.
+
+``vcfx`` binds its helpers, result classes and tool wrappers on first
+access through a module ``__getattr__``, which hides them from type
+checkers.  This script imports the package from the source tree and writes
+a stub listing every public name with its concrete signature.
+
+Run it after adding or changing a wrapper::
+
+    python scripts/generate_stubs.py
+"""
+from __future__ import annotations
+
+import importlib.util
+import inspect
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_DIR = ROOT / "python"
+STUB_PATH = PACKAGE_DIR / "__init__.pyi"
+
+HEADER = '''\
+# This file is generated by scripts/generate_stubs.py; do not edit by hand.
+from __future__ import annotations
+
+import os
+import subprocess
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Sequence,
+    Type,
+    TypeVar,
+)
+
+import numpy as np
+
+from . import results as results
+from . import tools as tools
+from .results import (
+{results}
+)
+
+T = TypeVar("T")
+
+__version__: str
+TOOL_NAMES: list[str]
+__all__: list[str]
+
+def trim(text: str) -> str: ...
+def split(text: str, delim: str) -> list[str]: ...
+def read_file_maybe_compressed(path: str) -> bytes: ...
+def read_maybe_compressed(data: bytes) -> bytes: ...
+def get_version() -> str: ...
+'''
+
+FOOTER = '''
+def __getattr__(name: str) -> Callable[..., subprocess.CompletedProcess]: ...
+'''
+
+
+def load_package() -> Any:
+    """Import ``vcfx`` from the source tree."""
+    spec = importlib.util.spec_from_file_location(
+        "vcfx", PACKAGE_DIR / "__init__.py"
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["vcfx"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def format_parameter(param: inspect.Parameter) -> str:
+    """Return *param* as it appears in a stub signature."""
+    text = param.name
+    if param.kind is inspect.Parameter.VAR_POSITIONAL:
+        text = "*" + text
+    elif param.kind is inspect.Parameter.VAR_KEYWORD:
+        text = "**" + text
+    if param.annotation is not inspect.Parameter.empty:
+        text += f": {param.annotation}"
+    if param.default is not inspect.Parameter.empty:
+        sep = " = " if param.annotation is not inspect.Parameter.empty else "="
+        text += f"{sep}{param.default!r}"
+    return text
+
+
+def format_function(name: str, func: Callable[..., Any]) -> str:
+    """Return a stub ``def`` line for *func* bound as *name*."""
+    sig = inspect.signature(func)
+    params = []
+    star_added = False
+    for param in sig.parameters.values():
+        if param.kind is inspect.Parameter.VAR_POSITIONAL:
+            star_added = True
+        if param.kind is inspect.Parameter.KEYWORD_ONLY and not star_added:
+            params.append("*")
+            star_added = True
+        params.append(format_parameter(param))
+    ret = sig.return_annotation
+    ret_text = "" if ret is inspect.Signature.empty else f" -> {ret}"
+    prefix = "async def" if inspect.iscoroutinefunction(func) else "def"
+    return f"{prefix} {name}({', '.join(params)}){ret_text}: ..."
+
+
+def main() -> None:
+    vcfx = load_package()
+    tools = vcfx.tools
+
+    # trim, split and the readers are listed verbatim in HEADER: they come
+    # from the C extension or builtin fallbacks, which cannot be
+    # introspected reliably.
+    lines = [
+        format_function(name, getattr(vcfx, name))
+        for name in (
+            "available_tools",
+            "run_tool",
+            "run_tool_stream",
+            "run_pipeline",
+            "run_tool_async",
+            "run_many",
+            "set_cache_size",
+            "clear_cache",
+            "make_runner",
+        )
+    ]
+    seen = set()
+    for name in tools.TOOL_NAMES:
+        if name in seen or name in ("available_tools", "run_tool"):
+            continue
+        seen.add(name)
+        lines.append(format_function(name, getattr(tools, name)))
+
+    results = "\n".join(f"    {name} as {name}," for name in vcfx._RESULT_NAMES)
+    STUB_PATH.write_text(
+        HEADER.format(results=results) + "\n".join(lines) + "\n" + FOOTER
+    )
+    print(f"Wrote {STUB_PATH.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,148 @@
 from __future__ import annotations
+import hashlib
 import os
+import shutil
 import subprocess
 from pathlib import Path
 import pytest
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
 ROOT_DIR = Path(__file__).resolve().parents[2]
 
+# Compile through sccache or ccache when one is installed, so a fresh build
+# tree (new checkout, cleared cache) mostly reuses cached objects.  An empty
+# launcher clears one left in CMakeCache.txt by an earlier configure.
+_LAUNCHER = shutil.which("sccache") or shutil.which("ccache") or ""
+
+CMAKE_ARGS = [
+    "-DPYTHON_BINDINGS=ON",
+    f"-DCMAKE_C_COMPILER_LAUNCHER={_LAUNCHER}",
+    f"-DCMAKE_CXX_COMPILER_LAUNCHER={_LAUNCHER}",
+]
+
+
+def _cache_root() -> Path:
+    """Return the directory holding the reusable build trees."""
+    env = os.environ.get("VCFX_TEST_BUILD_CACHE")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(base) / "vcfx-tests"
+
+
+def _configure_stamp() -> str:
+    """Hash the inputs that are only picked up when CMake configures.
+
+    ``cmake --build`` tracks the C++ sources itself, but the Python
+    package is copied into the build tree at configure time, so any change
+    to it (or to a ``CMakeLists.txt``) requires a fresh configure.
+    """
+    digest = hashlib.sha1(" ".join(CMAKE_ARGS).encode())
+    stack = [str(ROOT_DIR / "python"), str(ROOT_DIR / "src")]
+    entries = [str(ROOT_DIR / "CMakeLists.txt")]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif entry.name == "CMakeLists.txt" or entry.name.endswith(
+                    (".py", ".pyi")
+                ):
+                    entries.append(entry.path)
+    for path in sorted(entries):
+        st = os.stat(path)
+        digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def _build_targets() -> list[str]:
+    """Return the targets for the test build, or ``[]`` to build them all.
+
+    By default everything is built, since the per-tool tests between them
+    run every ``src/VCFX_*`` tool.  ``VCFX_TEST_TOOLS`` (comma or space
+    separated) restricts the build to the bindings and those tools while
+    iterating on one wrapper::
+
+        VCFX_TEST_TOOLS=allele_counter pytest tests/python -k allele_counter
+
+    The per-tool tests skip tools that were not built.
+    """
+    tools = os.environ.get("VCFX_TEST_TOOLS", "").replace(",", " ").split()
+    if not tools:
+        return []
+    return ["_vcfx", *(f"VCFX_{t}" for t in tools)]
+
 
 @pytest.fixture(scope="session")
-def build_dir(tmp_path_factory):
-    build = tmp_path_factory.mktemp("pybuild")
-    subprocess.check_call([
-        "cmake",
-        str(ROOT_DIR),
-        "-DPYTHON_BINDINGS=ON",
-    ], cwd=build)
-    subprocess.check_call(["cmake", "--build", ".", "--parallel"], cwd=build)
+def build_dir():
+    """Build the tools and bindings into a tree reused across sessions.
+
+    The tree lives under ``$VCFX_TEST_BUILD_CACHE`` (default
+    ``~/.cache/vcfx-tests``), one per source checkout.  CMake is only
+    re-run when a configure input changed; otherwise the build is
+    incremental and a no-op for unchanged sources.  A file lock lets
+    concurrent sessions (e.g. pytest-xdist workers) share one build.
+    """
+    key = hashlib.sha1(str(ROOT_DIR).encode()).hexdigest()[:16]
+    build = _cache_root() / key
+    build.mkdir(parents=True, exist_ok=True)
+    with open(build / ".lock", "w") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        stamp_file = build / ".configure-stamp"
+        stamp = _configure_stamp()
+        try:
+            configured = stamp_file.read_text() == stamp
+        except OSError:
+            configured = False
+        if not configured:
+            subprocess.check_call(
+                ["cmake", str(ROOT_DIR), *CMAKE_ARGS], cwd=build, close_fds=False
+            )
+            stamp_file.write_text(stamp)
+        # One target per invocation: several names after one --target
+        # need CMake 3.15, newer than cmake_minimum_required.
+        for target in _build_targets() or [None]:
+            cmd = ["cmake", "--build", ".", "--parallel"]
+            if target is not None:
+                cmd += ["--target", target]
+            subprocess.check_call(cmd, cwd=build, close_fds=False)
     return build
 
 
-@pytest.fixture()
-def vcfx(build_dir, monkeypatch):
-    python_dir = build_dir / "python"
-    monkeypatch.syspath_prepend(str(python_dir))
-
-    tool_dirs = []
-    src_dir = build_dir / "src"
-    if src_dir.is_dir():
-        for sub in src_dir.glob("VCFX_*"):
-            exe = sub / sub.name
-            if exe.is_file():
-                tool_dirs.append(str(sub))
-    if tool_dirs:
-        monkeypatch.setenv(
-            "PATH",
-            os.pathsep.join(tool_dirs + [os.environ.get("PATH", "")]),
-        )
-
-    import vcfx as module
-    return module
+@pytest.fixture(scope="session")
+def vcfx(build_dir, tmp_path_factory):
+    """Import the built package once, with the built tools on ``PATH``."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.syspath_prepend(str(build_dir / "python"))
+        # available_tools() persists its scan under XDG_CACHE_HOME
+        mp.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("xdg-cache")))
+
+        tool_dirs = []
+        src_dir = build_dir / "src"
+        if src_dir.is_dir():
+            for sub in src_dir.glob("VCFX_*"):
+                exe = sub / sub.name
+                if exe.is_file():
+                    tool_dirs.append(str(sub))
+        if tool_dirs:
+            mp.setenv(
+                "PATH",
+                os.pathsep.join(tool_dirs + [os.environ.get("PATH", "")]),
+            )
+
+        import vcfx as module
+        yield module
+
+
+@pytest.fixture(scope="session")
+def built_tools(vcfx):
+    """Names of the tools found on ``PATH``, looked up once per session."""
+    return frozenset(vcfx.available_tools())
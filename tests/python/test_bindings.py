@@ -1,31 +1,36 @@
 def test_python_bindings(vcfx):
     assert vcfx.trim("  hello  ") == "hello"
+    assert vcfx.trim("\0 hello\t\0") == "\0 hello\t\0"
     assert vcfx.read_maybe_compressed(b"hello") == b"hello"
 
 
 def test_read_file_maybe_compressed(vcfx, tmp_path):
     import gzip
 
-    p = tmp_path / "hello.txt.gz"
     data = b"hello world\n"
-    with gzip.open(p, "wb") as fh:
-        fh.write(data)
+    compressed = gzip.compress(data)
+    assert vcfx.read_maybe_compressed(compressed) == data
 
+    p = tmp_path / "hello.txt.gz"
+    p.write_bytes(compressed)
     result = vcfx.read_file_maybe_compressed(str(p))
     assert result == data
 
 
-def test_split_and_get_version(vcfx):
+def test_split_and_get_version(vcfx, monkeypatch):
     from pathlib import Path
-    import subprocess
-    import sys
 
     assert vcfx.split("a,b,c", ",") == ["a", "b", "c"]
 
     root = Path(__file__).resolve().parents[2]
-    expected = subprocess.check_output(
-        [sys.executable, str(root / "scripts" / "extract_version.py")],
-        text=True,
-    ).strip()
+    monkeypatch.syspath_prepend(str(root / "scripts"))
+    from extract_version import extract_version
+
+    expected = extract_version(root / "CMakeLists.txt")
     assert vcfx.get_version() == expected
     assert vcfx.__version__ == expected
+
+
+def test_dir_lists_no_typing_helpers(vcfx):
+    assert "TYPE_CHECKING" not in dir(vcfx)
+    assert "variant_counter" in dir(vcfx)
@@ -1,15 +1,52 @@
+import pytest
 from pathlib import Path
 
 DATA = Path(__file__).resolve().parents[1] / "data"
 
 
-def test_variant_counter_wrapper(vcfx):
-    from vcfx.tools import analysis as ta
-    count = ta.variant_counter(DATA / "variant_counter_normal.vcf")
-    assert count == 5
+def test_run_tool_stream(vcfx):
+    from vcfx.results import AlleleFrequency
+    vcf = DATA / "allele_freq_calc" / "simple.vcf"
+    with open(vcf, "rb") as fh:
+        rows = list(vcfx.run_tool_stream(
+            "allele_freq_calc", row_cls=AlleleFrequency, stdin=fh
+        ))
+    assert rows == vcfx.allele_freq_calc(vcf)
+    with open(vcf, "rb") as fh:
+        header = next(iter(vcfx.run_tool_stream("allele_freq_calc", stdin=fh)))
+    assert header[-1] == "Allele_Frequency"
 
 
-def test_allele_freq_calc_wrapper(vcfx):
-    from vcfx.tools import analysis as ta
-    freqs = ta.allele_freq_calc(DATA / "allele_freq_calc" / "simple.vcf")
-    assert abs(freqs[0].Allele_Frequency - 0.5) < 1e-6
+def test_run_pipeline(vcfx):
+    vcf = DATA / "allele_freq_calc" / "simple.vcf"
+    lines = list(vcfx.run_pipeline(
+        [("variant_classifier", ["--append-info"]), ("allele_freq_calc", [])],
+        vcf,
+    ))
+    with open(vcf, "rb") as fh:
+        annotated = vcfx.run_tool(
+            "variant_classifier", "--append-info", stdin=fh,
+            capture_output=True,
+        ).stdout
+    expected = vcfx.run_tool(
+        "allele_freq_calc", input=annotated, capture_output=True
+    ).stdout
+    assert "".join(lines) == expected
+    assert list(vcfx.run_pipeline([("allele_freq_calc", [])], vcf, text=False))
+    with pytest.raises(ValueError):
+        next(vcfx.run_pipeline([], vcf))
+
+
+def test_run_many(vcfx):
+    import asyncio
+    files = [DATA / "variant_counter_normal.vcf",
+             DATA / "allele_freq_calc" / "simple.vcf"]
+    results = asyncio.run(vcfx.run_many(
+        [("variant_counter", [], f) for f in files], limit=2
+    ))
+    for path, result in zip(files, results):
+        with open(path, "rb") as fh:
+            expected = vcfx.run_tool(
+                "variant_counter", stdin=fh, capture_output=True
+            )
+        assert result.stdout == expected.stdout
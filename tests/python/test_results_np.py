@@ -0,0 +1,111 @@
+import io
+from pathlib import Path
+
+import pytest
+
+DATA = Path(__file__).resolve().parents[1] / "data"
+
+
+def test_columnar_loaders(vcfx):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("pandas")
+    from vcfx import results_np
+    from vcfx.results import AlleleFrequency
+
+    freqs = results_np.allele_freq_calc_frame(
+        DATA / "allele_freq_calc" / "simple.vcf"
+    )
+    assert str(freqs["POS"].dtype) == "int32"
+    assert abs(freqs["Allele_Frequency"].iloc[0] - 0.5) < 1e-6
+    records = results_np.to_records(freqs, AlleleFrequency)
+    expected = vcfx.allele_freq_calc(DATA / "allele_freq_calc" / "simple.vcf")
+    assert [(r.CHROM, r.POS, r.ALT) for r in records] == [
+        (r.CHROM, r.POS, r.ALT) for r in expected
+    ]
+    assert [r.Allele_Frequency for r in records] == pytest.approx(
+        [r.Allele_Frequency for r in expected], rel=1e-6
+    )
+
+    tsv = b"CHROM\tPOS\tID\tREF\tALT\tDosages\n1\t10\t.\tA\tG\t0,1,NA\n"
+    variants, dosages = results_np.read_dosage_tsv(io.BytesIO(tsv))
+    assert list(variants["POS"]) == [10]
+    assert dosages.shape == (1, 3) and dosages.dtype == np.float32
+    assert dosages[0, 1] == 1 and np.isnan(dosages[0, 2])
+
+
+def test_read_dosage_tsv_row_widths(vcfx):
+    pytest.importorskip("pandas")
+    from vcfx import results_np
+
+    header = b"CHROM\tPOS\tID\tREF\tALT\tDosages\n"
+    ragged = header + b"1\t10\t.\tA\tG\t0,1\n1\t20\t.\tC\tT\t0,1,2,1\n"
+    with pytest.raises(ValueError, match="differing numbers"):
+        results_np.read_dosage_tsv(io.BytesIO(ragged))
+
+    no_samples = header + b"1\t10\t.\tA\tG\t\n1\t20\t.\tC\tT\t\n"
+    variants, dosages = results_np.read_dosage_tsv(io.BytesIO(no_samples))
+    assert len(variants) == 2 and dosages.shape == (2, 0)
+
+
+def test_iterate_variants(vcfx):
+    pytest.importorskip("pandas")
+    from vcfx import results_np
+
+    chunks = list(results_np.iterate_variants(
+        DATA / "variant_counter_normal.vcf",
+        fields=("POS", "QUAL"),
+        chunk_size=3,
+    ))
+    assert [len(c["POS"]) for c in chunks] == [3, 2]
+    assert str(chunks[0]["POS"].dtype) == "int32"
+    assert chunks[0]["POS"][0] == 10000
+    with pytest.raises(ValueError):
+        next(results_np.iterate_variants(DATA / "variant_counter_normal.vcf",
+                                         fields=("GT",)))
+
+
+def test_empty_inputs(vcfx, tmp_path):
+    pytest.importorskip("pandas")
+    from vcfx import results_np
+
+    vcf = tmp_path / "empty.vcf"
+    vcf.write_text("##fileformat=VCFv4.2\n#CHROM\tPOS\tID\tREF\tALT\n")
+    assert list(results_np.iterate_variants(vcf)) == []
+
+    freqs = results_np.read_allele_frequency_tsv(io.BytesIO(b""))
+    assert freqs.empty and "Allele_Frequency" in freqs.columns
+    variants, dosages = results_np.read_dosage_tsv(io.BytesIO(b""))
+    assert variants.empty and dosages.shape == (0, 0)
+
+
+def test_dosages_array(vcfx):
+    np = pytest.importorskip("numpy")
+    from vcfx.results import DosageRow
+
+    row = DosageRow("1", 10, ".", "A", "G", "0,1,NA,2")
+    arr = row.dosages_array()
+    assert arr.dtype == np.float32
+    assert list(arr[[0, 1, 3]]) == [0, 1, 2] and np.isnan(arr[2])
+    odd = DosageRow("1", 10, ".", "A", "G", "NaN,1.5,x").dosages_array()
+    assert np.isnan(odd[0]) and odd[1] == 1.5 and np.isnan(odd[2])
+    plain = DosageRow("1", 10, ".", "A", "G", "0,1.5,nan").dosages_array()
+    assert plain.dtype == np.float32 and plain[1] == 1.5 and np.isnan(plain[2])
+
+
+def test_wrapper_as_arrays(vcfx):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("pandas")
+
+    vcf = DATA / "allele_freq_calc" / "simple.vcf"
+    arrays = vcfx.allele_freq_calc(vcf, as_arrays=True)
+    rows = vcfx.allele_freq_calc(vcf)
+    assert arrays["POS"].dtype == np.int64
+    assert list(arrays["POS"]) == [r.POS for r in rows]
+    assert list(arrays["Allele_Frequency"]) == pytest.approx(
+        [r.Allele_Frequency for r in rows]
+    )
+
+    dosage = vcfx.dosage_calculator(
+        DATA / "dosage_calculator" / "basic.vcf", as_arrays=True
+    )
+    assert dosage["Dosages"].shape[0] == len(dosage["POS"])
@@ -1,21 +1,33 @@
 from pathlib import Path
 
+import pytest
+
 DATA = Path(__file__).resolve().parents[1] / "data"
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+TESTED = {
+    'alignment_checker', 'allele_counter', 'variant_counter', 'allele_freq_calc',
+    'info_aggregator', 'info_parser', 'info_summarizer', 'fasta_converter',
+    'allele_balance_calc', 'concordance_checker', 'genotype_query',
+    'duplicate_remover', 'af_subsetter', 'missing_detector', 'hwe_tester',
+    'inbreeding_calculator', 'variant_classifier', 'cross_sample_concordance',
+    'field_extractor', 'ancestry_assigner', 'dosage_calculator',
+    'ancestry_inferrer', 'distance_calculator', 'indel_normalizer', 'validator',
+}
+
+# Every tool in the source tree that has no dedicated wrapper test, one test
+# each so that pytest-xdist can run them in parallel
+UNTESTED = sorted(
+    name
+    for name in (p.name[len("VCFX_"):] for p in SRC.glob("VCFX_*") if p.is_dir())
+    if name not in TESTED
+)
 
 
-def test_tool_wrappers_extra(vcfx):
-    from vcfx.tools import available_tools, run_tool
-    tested = {
-        'alignment_checker', 'allele_counter', 'variant_counter', 'allele_freq_calc',
-        'info_aggregator', 'info_parser', 'info_summarizer', 'fasta_converter',
-        'allele_balance_calc', 'concordance_checker', 'genotype_query',
-        'duplicate_remover', 'af_subsetter', 'missing_detector', 'hwe_tester',
-        'inbreeding_calculator', 'variant_classifier', 'cross_sample_concordance',
-        'field_extractor', 'ancestry_assigner', 'dosage_calculator',
-        'ancestry_inferrer', 'distance_calculator', 'indel_normalizer', 'validator',
-    }
-    all_tools = available_tools()
-    untested = sorted(set(all_tools) - tested)
-    for tool in untested:
-        proc = run_tool(tool, '--help', capture_output=True, text=True)
-        assert proc.returncode == 0
+@pytest.mark.parametrize("tool", UNTESTED)
+def test_tool_wrappers_extra(vcfx, built_tools, tool):
+    from vcfx.tools import run_tool
+    if tool not in built_tools:
+        pytest.skip(f"VCFX_{tool} was not built")
+    proc = run_tool(tool, '--help', capture_output=True, text=True)
+    assert proc.returncode == 0
@@ -1,6 +1,12 @@
+import importlib.util
+import json
+import pickle
+import signal
+import subprocess
 import sys
 from pathlib import Path
-import importlib.util
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 spec = importlib.util.spec_from_file_location("vcfx", ROOT / "python" / "__init__.py")
@@ -9,11 +15,247 @@ sys.modules["vcfx"] = vcfx
 spec.loader.exec_module(vcfx)  # type: ignore
 
 
-def test_run_tool_fallback(tmp_path, monkeypatch):
-    wrapper = tmp_path / "vcfx"
-    wrapper.write_text("#!/bin/sh\necho $1\n")
-    wrapper.chmod(0o755)
+@pytest.fixture(autouse=True)
+def isolated_tool_cache(tmp_path, monkeypatch):
+    """Isolate the persisted tool list and the in-process tool caches."""
+    base = vcfx.tools.base
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+    monkeypatch.setattr(base, "_TOOL_CACHE", None)
+    monkeypatch.setattr(base, "_TOOL_SET", frozenset())
+    monkeypatch.setattr(base, "_EXE_CACHE", {})
+    monkeypatch.setattr(base, "_EXE_CACHE_PATH", None)
+
+
+@pytest.fixture
+def dummy_tool(tmp_path, monkeypatch):
+    """Return a function writing an executable shell script.
+
+    ``dummy_tool(name, body)`` creates ``name`` (e.g. ``"VCFX_dummytool"``)
+    running the shell code *body*, by default in ``tmp_path``, which is put
+    first on ``PATH``.
+    """
     monkeypatch.setenv("PATH", f"{tmp_path}:/usr/bin:/bin")
 
+    def make(name, body, directory=tmp_path):
+        script = directory / name
+        script.write_text(f"#!/bin/sh\n{body}\n")
+        script.chmod(0o755)
+        return script
+
+    return make
+
+
+@pytest.fixture
+def empty_vcf(tmp_path):
+    """An empty input file; the dummy tools do not read it."""
+    vcf = tmp_path / "in.vcf"
+    vcf.write_text("")
+    return vcf
+
+
+def test_run_tool_fallback(dummy_tool):
+    dummy_tool("vcfx", "echo $1")
+
     proc = vcfx.run_tool("dummytool", capture_output=True, text=True)
     assert proc.stdout.strip() == "dummytool"
+
+
+def test_run_tool_rejects_stdin_and_input(dummy_tool):
+    tool = dummy_tool("VCFX_dummytool", "cat")
+
+    with open(tool, "rb") as fh, pytest.raises(ValueError, match="stdin and input"):
+        vcfx.run_tool("dummytool", stdin=fh, input="x", capture_output=True)
+
+
+def test_run_tool_direct_spawn(dummy_tool):
+    tool = dummy_tool("VCFX_dummytool", "exit 3")
+
+    proc = vcfx.run_tool("dummytool", "x", check=False)
+    assert proc.returncode == 3
+    assert proc.args == [str(tool), "x"]
+
+
+@pytest.mark.skipif(
+    not Path("/proc/self/status").exists(), reason="needs /proc/<pid>/status"
+)
+def test_run_tool_spawn_restores_sigpipe(tmp_path, dummy_tool):
+    dummy_tool("VCFX_dummytool", "grep SigIgn /proc/$$/status")
+    out = tmp_path / "out.txt"
+
+    with open(out, "wb") as fh:
+        vcfx.run_tool("dummytool", stdout=fh)
+    ignored = int(out.read_text().split()[1], 16)
+    assert not ignored & (1 << (signal.SIGPIPE - 1))
+
+
+def test_available_tools_refresh_clears_exe_cache(tmp_path, monkeypatch, dummy_tool):
+    first = tmp_path / "a"
+    second = tmp_path / "b"
+    for d in (first, second):
+        d.mkdir()
+    tool = dummy_tool("VCFX_dummytool", "exit 0", second)
+    monkeypatch.setenv("PATH", f"{first}:{second}:/usr/bin:/bin")
+    assert vcfx.run_tool("dummytool").args == [str(tool)]
+
+    shadow = dummy_tool("VCFX_dummytool", "exit 0", first)
+    vcfx.available_tools(refresh=True)
+    assert vcfx.run_tool("dummytool").args == [str(shadow)]
+
+
+def test_parsed_wrapper_reports_stderr(dummy_tool, empty_vcf):
+    dummy_tool(
+        "VCFX_allele_freq_calc", "printf 'CHROM\\tPOS\\n'\necho boom >&2\nexit 2"
+    )
+
+    with pytest.raises(subprocess.CalledProcessError) as info:
+        vcfx.allele_freq_calc(str(empty_vcf))
+    assert info.value.returncode == 2
+    assert info.value.stderr.strip() == "boom"
+
+
+def test_columnar_wrapper_reports_stderr(dummy_tool, empty_vcf):
+    pytest.importorskip("pandas")
+    dummy_tool(
+        "VCFX_allele_freq_calc", "printf 'CHROM\\tPOS\\n'\necho boom >&2\nexit 2"
+    )
+
+    with pytest.raises(subprocess.CalledProcessError) as info:
+        vcfx.results_np.allele_freq_calc_frame(str(empty_vcf))
+    assert info.value.returncode == 2
+    assert info.value.stderr.strip() == "boom"
+
+
+def test_memoized_wrapper(tmp_path, dummy_tool, empty_vcf):
+    calls = tmp_path / "calls"
+    dummy_tool("VCFX_variant_counter", f"echo x >> {calls}\necho 'Total Variants: 7'")
+    vcf = empty_vcf
+
+    vcfx.set_cache_size(4)
+    try:
+        assert vcfx.variant_counter(str(vcf)) == 7
+        assert vcfx.variant_counter(str(vcf)) == 7
+        assert calls.read_text().count("x") == 1
+        vcf.write_text("changed")
+        assert vcfx.variant_counter(str(vcf)) == 7
+        assert calls.read_text().count("x") == 2
+        vcfx.clear_cache()
+        vcfx.variant_counter(str(vcf))
+        assert calls.read_text().count("x") == 3
+    finally:
+        vcfx.set_cache_size(0)
+
+
+def test_memoized_results_are_copies(tmp_path, dummy_tool, empty_vcf):
+    calls = tmp_path / "calls"
+    dummy_tool(
+        "VCFX_field_extractor",
+        f"echo x >> {calls}\nprintf 'CHROM\\tPOS\\nchr1\\t1\\n'",
+    )
+    vcf = str(empty_vcf)
+
+    vcfx.set_cache_size(4)
+    try:
+        rows = vcfx.field_extractor(vcf, fields=["CHROM", "POS"])
+        rows[0]["CHROM"] = "changed"
+        again = vcfx.field_extractor(vcf, fields=["CHROM", "POS"])
+        assert again == [{"CHROM": "chr1", "POS": "1"}]
+        assert calls.read_text().count("x") == 1
+
+        columns = vcfx.field_extractor(vcf, ["CHROM"], columnar=True)
+        columns["CHROM"].append("extra")
+        assert vcfx.field_extractor(vcf, ["CHROM"], columnar=True) == {
+            "CHROM": ["chr1"], "POS": ["1"]
+        }
+        assert calls.read_text().count("x") == 2
+    finally:
+        vcfx.set_cache_size(0)
+
+
+def test_run_tool_spawn_redirects(tmp_path, dummy_tool):
+    dummy_tool("VCFX_dummytool", "tr a-z A-Z")
+    src = tmp_path / "in.txt"
+    src.write_text("abc\n")
+    dst = tmp_path / "out.txt"
+
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        proc = vcfx.run_tool("dummytool", stdin=fin, stdout=fout)
+    assert proc.stdout is None
+    assert dst.read_text() == "ABC\n"
+
+
+def test_make_runner(dummy_tool):
+    dummy_tool("VCFX_dummytool", 'echo "$@"')
+
+    runner = vcfx.make_runner("dummytool", "--strict", 3)
+    proc = runner("x", capture_output=True)
+    assert proc.stdout == "--strict 3 x\n"
+    clone = pickle.loads(pickle.dumps(runner))
+    assert clone("y", capture_output=True).stdout == "--strict 3 y\n"
+
+
+def test_available_tools_persisted(tmp_path, monkeypatch, dummy_tool):
+    bindir = tmp_path / "bin"
+    bindir.mkdir()
+    tool = dummy_tool("VCFX_dummytool", "exit 0", bindir)
+    monkeypatch.setenv("PATH", f"{bindir}:/usr/bin:/bin")
+
+    assert "dummytool" in vcfx.available_tools(refresh=True)
+    stored = tmp_path / "xdg-cache" / "vcfx" / "tools.json"
+    data = json.loads(stored.read_text())
+    assert data["tools"]["dummytool"] == str(tool)
+
+    # A fresh interpreter with the same PATH reuses the stored scan.
+    data["tools"]["othertool"] = str(tool)
+    stored.write_text(json.dumps(data))
+    monkeypatch.setattr(vcfx.tools.base, "_TOOL_CACHE", None)
+    assert "othertool" in vcfx.available_tools()
+    assert "othertool" not in vcfx.available_tools(refresh=True)
+
+
+def test_samples_option(dummy_tool, empty_vcf):
+    dummy_tool("VCFX_sample_extractor", 'echo "$@"')
+    vcf = str(empty_vcf)
+
+    samples = ["S1", "S2"]
+    assert vcfx.sample_extractor(vcf, samples) == "--samples S1 S2\n"
+    assert vcfx.sample_extractor(vcf, samples) == "--samples S1 S2\n"
+    assert vcfx.tools.base._samples_option.cache_info().hits >= 1
+    dup = vcfx.sample_extractor(vcf, ["S2", "S1", "S2"])
+    assert dup == "--samples S2 S1\n"
+
+    with pytest.raises(ValueError):
+        vcfx.sample_extractor(vcf, ["S1 S2"])
+    with pytest.raises(ValueError, match="at least one sample"):
+        vcfx.sample_extractor(vcf, [])
+
+
+def test_concordance_checker_keeps_equal_samples(tmp_path, dummy_tool, empty_vcf):
+    argv = tmp_path / "argv"
+    dummy_tool("VCFX_concordance_checker", f'echo "$@" > {argv}')
+
+    vcfx.concordance_checker(str(empty_vcf), "A", "A")
+    assert argv.read_text() == "--samples A A\n"
+
+
+def test_tsv_rows_short_and_long():
+    from vcfx.results import AlleleFrequency
+    from vcfx.tools.base import _tsv_to_dataclasses
+
+    text = "CHROM\tPOS\tID\tREF\tALT\tAllele_Frequency\n1\t10\t.\tA\n"
+    (row,) = _tsv_to_dataclasses(text, AlleleFrequency)
+    assert row.POS == 10 and row.ALT is None and row.Allele_Frequency is None
+
+    with pytest.raises(ValueError, match="expected 6"):
+        _tsv_to_dataclasses(text + "1\t10\t.\tA\tG\t0.5\textra\n", AlleleFrequency)
+
+
+def test_ancestry_assigner_rejects_malformed_lines(dummy_tool, empty_vcf):
+    tool = dummy_tool("VCFX_ancestry_assigner", "printf 'S1\\tEUR\\n\\nS2\\tAFR\\n'")
+    rows = vcfx.ancestry_assigner(str(empty_vcf), "freq.tsv")
+    assert [(r.Sample, r.Assigned_Population) for r in rows] == [
+        ("S1", "EUR"), ("S2", "AFR")
+    ]
+
+    tool.write_text("#!/bin/sh\nprintf 'S1\\tEUR\\nS2\\tAFR\\textra\\n'\n")
+    with pytest.raises(ValueError, match="extra"):
+        vcfx.ancestry_assigner(str(empty_vcf), "freq.tsv")